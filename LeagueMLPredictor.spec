@@ -5,7 +5,7 @@ a = Analysis(
     ['lol_overlay.py'],
     pathex=[],
     binaries=[],
-    datas=[('league_win_predictor.pkl', '.'), ('scaler.pkl', '.')],
+    datas=[('league_win_predictor.pkl', '.'), ('scaler.pkl', '.'), ('risk_score/death_model.pkl', 'risk_score'), ('tip_table.json', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
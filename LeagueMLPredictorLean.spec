@@ -0,0 +1,58 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# Lean, fast-starting build of lol_overlay.py:
+#   pyinstaller LeagueMLPredictorLean.spec
+#   python startup_report.py --exe dist/LeagueMLPredictor/LeagueMLPredictor.exe --launch 5
+#
+# - one-dir: nothing is unpacked to a temp dir on every launch
+# - no UPX: compressed DLLs have to be decompressed on every launch too
+# - the model ships as league_win_predictor.npz (folded weights), so
+#   pandas / scikit-learn / scipy / joblib are not bundled at all
+
+
+a = Analysis(
+    ['lol_overlay.py'],
+    pathex=[],
+    binaries=[],
+    datas=[('league_win_predictor.npz', '.'), ('tip_table.json', '.')],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[
+        'pandas', 'sklearn', 'scipy', 'joblib', 'threadpoolctl',
+        'pyarrow', 'matplotlib', 'IPython', 'jupyter', 'notebook',
+        'pytest', 'numpy.f2py', 'numpy.distutils', 'numpy.testing',
+    ],
+    noarchive=False,
+    optimize=1,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='LeagueMLPredictor',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='LeagueMLPredictor',
+)
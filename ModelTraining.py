@@ -1,76 +1,244 @@
 #trains model on data formatted and generated by data collector file
+#
+#   python ModelTraining.py                -> full retrain from the whole CSV
+#   python ModelTraining.py --incremental  -> update with the rows the current model
+#                                             hasn't seen yet (warm-started refit)
 
+import argparse
+import json
+import os
+
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score
+from sklearn.metrics import accuracy_score, log_loss
 import pickle
 
-# Load the CSV
-data = pd.read_csv('lol_training_data.csv')
+from feature_cache import load_feature_matrix
+from win_model import FEATURE_COLS, fold_scaler, save_artifact
+
+# ---------- CONFIG ----------
+DATA_FILE = 'lol_training_data.csv'
+MODEL_FILE = 'league_win_predictor.pkl'
+SCALER_FILE = 'scaler.pkl'
+STATE_FILE = 'training_state.json'   # which rows the current model has seen + its metrics (local, not committed)
+ACCURACY_TOLERANCE = 0.01            # incremental model may lose at most this much holdout accuracy
+LOG_LOSS_TOLERANCE = 0.02            # ...and gain at most this much holdout log loss
+# ----------------------------
+
+
+def row_keys(data):
+    """One key per CSV row (a match is split into 10/20/30 min rows)"""
+    return np.char.add(np.char.add(data.match_ids, ':'), data.timestamps.astype(str))
+
+
+def load_state():
+    if not os.path.exists(STATE_FILE):
+        return None
+    with open(STATE_FILE) as f:
+        return json.load(f)
+
+
+def save_state(state):
+    tmp_file = STATE_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_file, STATE_FILE)
+
+
+def save_model(model, scaler):
+    # Save model
+    with open(MODEL_FILE, 'wb') as f:
+        pickle.dump(model, f)
+
+    # Save scaler (IMPORTANT!)
+    with open(SCALER_FILE, 'wb') as f:
+        pickle.dump(scaler, f)
+
+    # Pickle-free copy for the overlay / frozen build
+    save_artifact(fold_scaler(model, scaler))
+
+
+def load_model():
+    with open(MODEL_FILE, 'rb') as f:
+        model = pickle.load(f)
+    with open(SCALER_FILE, 'rb') as f:
+        scaler = pickle.load(f)
+    return model, scaler
+
+
+def evaluate(model, scaler, X, y):
+    """Accuracy + log loss on an unscaled feature matrix"""
+    X_scaled = scaler.transform(X)
+    probabilities = model.predict_proba(X_scaled)
+    return {
+        'accuracy': float(accuracy_score(y, model.predict(X_scaled))),
+        'log_loss': float(log_loss(y, probabilities, labels=[0, 1])),
+    }
+
+
+def train_full(data):
+    """Retrain from scratch on the whole CSV (original behaviour)"""
+    X = data.X
+    y = data.y
+    keys = row_keys(data)
+
+    X_train, X_test, y_train, y_test, keys_train, keys_test = train_test_split(
+        X, y, keys,
+        test_size=0.2,
+        random_state=42
+    )
+
+    scaler = StandardScaler()
+
+    X_train_scaled = scaler.fit_transform(X_train)
+
+    model = LogisticRegression(max_iter=1000)
+    model.fit(X_train_scaled, y_train)
+
+    train_metrics = evaluate(model, scaler, X_train, y_train)
+    test_metrics = evaluate(model, scaler, X_test, y_test)
+
+    print("\n Model Performance:")
+    print(f"Training Accuracy: {train_metrics['accuracy']:.2%}")
+    print(f"Testing Accuracy:  {test_metrics['accuracy']:.2%}")
+
+    save_model(model, scaler)
+    save_state({
+        'version': 1,
+        'seen_rows': keys_train.tolist(),
+        'holdout_rows': keys_test.tolist(),
+        'metrics': test_metrics,
+    })
+
+    return model, scaler, X_test, y_test
+
+
+def rebase_coefficients(model, old_mean, old_scale, new_mean, new_scale):
+    """
+    Re-express the linear model in the new scaler's space so the warm start
+    begins from exactly the same decision function the old model had.
+
+    logit = w . (x - m_old) / s_old + b
+          = (w * s_new / s_old) . (x - m_new) / s_new + b + w . (m_new - m_old) / s_old
+    """
+    w = model.coef_[0]
+    model.coef_ = (w * new_scale / old_scale).reshape(1, -1)
+    model.intercept_ = model.intercept_ + np.dot(w, (new_mean - old_mean) / old_scale)
 
-X = data.drop(['match_id', 'timestamp_min', 'blue_win'], axis=1)
-y = data['blue_win']
 
+def train_incremental(data, state):
+    """
+    Update the saved scaler + model with only the rows they haven't seen.
 
+    New rows are split 80/20 like the full retrain; the 20% joins the holdout
+    set. The updated model is only written if it holds up on that holdout.
 
+    The refit covers the seen rows plus the new ones: warm starting only
+    changes lbfgs's starting point, so a fit on the new rows alone would just
+    converge to their optimum and forget the rest. Starting from the previous
+    weights, the refit on everything takes a handful of iterations.
+    """
+    model, scaler = load_model()
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, 
-    test_size=0.2,    
-    random_state=42   
-)
+    seen = set(state['seen_rows'])
+    holdout = set(state['holdout_rows'])
+    keys = row_keys(data)
+    new_idx = np.flatnonzero([k not in seen and k not in holdout for k in keys])
 
+    if len(new_idx) == 0:
+        print("✓ No new rows since last training run, nothing to do")
+        return None
 
-scaler = StandardScaler()
+    print(f"📊 {len(new_idx)} new rows (model has seen {len(seen)})")
 
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
+    if len(new_idx) >= 5:
+        train_idx, test_idx = train_test_split(new_idx, test_size=0.2, random_state=42)
+    else:
+        train_idx, test_idx = new_idx, new_idx[:0]
 
+    holdout |= set(keys[test_idx].tolist())
+    holdout_mask = np.array([k in holdout for k in keys])
+    X_holdout = data.X[holdout_mask]
+    y_holdout = data.y[holdout_mask]
+    X_new = data.X[train_idx]
+    fit_mask = np.array([k in seen for k in keys])
+    fit_mask[train_idx] = True
+    X_fit, y_fit = data.X[fit_mask], data.y[fit_mask]
 
-model = LogisticRegression(max_iter=1000)
-model.fit(X_train_scaled, y_train)
+    old_metrics = evaluate(model, scaler, X_holdout, y_holdout)
+
+    # update scaler statistics with the new rows only
+    old_mean, old_scale = scaler.mean_.copy(), scaler.scale_.copy()
+    scaler.partial_fit(X_new)
+    rebase_coefficients(model, old_mean, old_scale, scaler.mean_, scaler.scale_)
 
-# print(model.score(X,y))
+    # warm start from the previous weights, refit on seen + new rows
+    if len(np.unique(y_fit)) == 2:
+        model.set_params(warm_start=True, max_iter=1000)
+        model.fit(scaler.transform(X_fit), y_fit)
+        model.set_params(warm_start=False)
+        print(f"🔁 Refit on {fit_mask.sum()} rows in {int(model.n_iter_[0])} iterations")
 
+    new_metrics = evaluate(model, scaler, X_holdout, y_holdout)
 
-train_predictions = model.predict(X_train_scaled)
-train_accuracy = accuracy_score(y_train, train_predictions)
+    print("\n Holdout Performance:")
+    print(f"Current model: {old_metrics['accuracy']:.2%} (log loss {old_metrics['log_loss']:.4f})")
+    print(f"Updated model: {new_metrics['accuracy']:.2%} (log loss {new_metrics['log_loss']:.4f})")
 
-test_predictions = model.predict(X_test_scaled)
-test_accuracy = accuracy_score(y_test, test_predictions)
+    if (new_metrics['accuracy'] + ACCURACY_TOLERANCE < old_metrics['accuracy']
+            or new_metrics['log_loss'] - LOG_LOSS_TOLERANCE > old_metrics['log_loss']):
+        print("✗ Updated model is worse on holdout, keeping the current version")
+        return None
 
-# print("\n Model Performance:")
-# print(f"Training Accuracy: {train_accuracy:.2%}")
-# print(f"Testing Accuracy:  {test_accuracy:.2%}")
+    state['version'] += 1
+    state['seen_rows'] = sorted(seen | set(keys[train_idx].tolist()))
+    state['holdout_rows'] = sorted(holdout)
+    state['metrics'] = new_metrics
 
-# print("\n Detailed Test Results:")
-# print(classification_report(y_test, test_predictions, 
-#                           target_names=['Red Win', 'Blue Win']))
+    save_model(model, scaler)
+    save_state(state)
+    print(f"💾 Saved model version {state['version']}")
+
+    return model, scaler, X_holdout, y_holdout
 
 
-# Save model
-with open('league_win_predictor.pkl', 'wb') as f:
-    pickle.dump(model, f)
+def main():
+    parser = argparse.ArgumentParser(description="Train the league win predictor")
+    parser.add_argument('--incremental', action='store_true',
+                        help="update the saved model with rows it hasn't seen (warm-started refit)")
+    args = parser.parse_args()
 
-# Save scaler (IMPORTANT!)
-with open('scaler.pkl', 'wb') as f:
-    pickle.dump(scaler, f)
+    # Load the CSV (parsed once, then memory-mapped from .feature_cache/)
+    data = load_feature_matrix(DATA_FILE, FEATURE_COLS)
 
-# print("\n💾 Model Saved!")
-# print("Files created:")
-# print("  - league_win_predictor.pkl")
-# print("  - scaler.pkl")
+    state = load_state() if args.incremental else None
+    if args.incremental and (state is None or not os.path.exists(MODEL_FILE)):
+        print(f"⚠ No {STATE_FILE} here (it's written by the last local run), falling back to a full retrain")
+
+    if state is not None and os.path.exists(MODEL_FILE):
+        result = train_incremental(data, state)
+    else:
+        result = train_full(data)
+
+    if result is None:
+        return
+    model, scaler, X_test, y_test = result
 
-sample_game = X_test.iloc[0:1]  # First test game
-sample_game_scaled = scaler.transform(sample_game)
+    sample_game = X_test[0:1]  # First test game
+    sample_game_scaled = scaler.transform(sample_game)
+
+    prediction = model.predict(sample_game_scaled)[0]
+    probability = model.predict_proba(sample_game_scaled)[0]
+
+    print("\n🎮 Sample Prediction:")
+    print(f"Game stats:\n{pd.Series(sample_game[0], index=FEATURE_COLS)}")
+    print(f"\nPrediction: {'Blue Wins' if prediction == 1 else 'Red Wins'}")
+    print(f"Confidence: Blue {probability[1]:.1%} | Red {probability[0]:.1%}")
+    print(f"Actual result: {'Blue Won' if y_test[0] == 1 else 'Red Won'}")
 
-prediction = model.predict(sample_game_scaled)[0]
-probability = model.predict_proba(sample_game_scaled)[0]
 
-print("\n🎮 Sample Prediction:")
-print(f"Game stats:\n{sample_game.iloc[0]}")
-print(f"\nPrediction: {'Blue Wins' if prediction == 1 else 'Red Wins'}")
-print(f"Confidence: Blue {probability[1]:.1%} | Red {probability[0]:.1%}")
-print(f"Actual result: {'Blue Won' if y_test.iloc[0] == 1 else 'Red Won'}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
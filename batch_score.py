@@ -0,0 +1,164 @@
+#scores a whole dataset offline and writes per-match win-probability curves
+#
+#   python batch_score.py lol_training_data.csv
+#   python batch_score.py games.parquet -o curves.csv --workers 8
+#
+#input needs match_id, timestamp_min and the model's feature columns (same
+#layout data_collector.py writes). If blue_win is present too, a drift report
+#(calibration / accuracy / log loss per minute) is printed at the end.
+#
+#the file is split into byte ranges (CSV) or row groups (parquet) and each
+#worker process parses + scores its own piece, so parsing uses every core too
+
+import argparse
+import io
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+from win_model import FEATURE_COLS, MODEL_FILE, SCALER_FILE, load_linear_model, predict_blue_proba
+
+# ---------- CONFIG ----------
+CHUNK_BYTES = 64 << 20       # CSV piece handed to one worker
+EPS = 1e-15                  # clip for log loss
+# ----------------------------
+
+KEY_COLS = ['match_id', 'timestamp_min']
+LABEL_COL = 'blue_win'
+
+_worker_model = None
+
+
+def _init_worker(model_file, scaler_file):
+    global _worker_model
+    _worker_model = load_linear_model(model_file, scaler_file)
+
+
+def csv_chunks(path, chunk_bytes):
+    """Yield (start, end) byte ranges that each begin at a line boundary"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.readline()  # header
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = f.tell()
+            yield start, end
+            start = end
+
+
+def _read_piece(task):
+    kind, path, piece, header, columns = task
+
+    if kind == 'csv':
+        start, end = piece
+        with open(path, 'rb') as f:
+            f.seek(start)
+            raw = f.read(end - start)
+        return pd.read_csv(io.BytesIO(raw), header=None, names=header, usecols=columns)
+
+    import pyarrow.parquet as pq
+    table = pq.ParquetFile(path).read_row_group(piece, columns=columns)
+    return table.to_pandas()
+
+
+def _minute_stats(chunk, probs):
+    """Per-minute sums for the drift report (merged across workers)"""
+    labels = chunk[LABEL_COL].to_numpy(dtype=np.float64)
+    clipped = np.clip(probs, EPS, 1 - EPS)
+    frame = pd.DataFrame({
+        'timestamp_min': chunk['timestamp_min'].to_numpy(),
+        'rows': 1,
+        'prob_sum': probs,
+        'label_sum': labels,
+        'correct': ((probs >= 0.5) == (labels == 1)).astype(np.int64),
+        'log_loss_sum': -(labels * np.log(clipped) + (1 - labels) * np.log(1 - clipped)),
+    })
+    return frame.groupby('timestamp_min').sum()
+
+
+def score_piece(task):
+    """Worker: parse one piece of the input and score every row in it"""
+    chunk = _read_piece(task)
+    probs = predict_blue_proba(chunk[FEATURE_COLS].to_numpy(dtype=np.float64), _worker_model)
+
+    curves = pd.DataFrame({
+        'match_id': chunk['match_id'].to_numpy(),
+        'timestamp_min': chunk['timestamp_min'].to_numpy(),
+        'blue_win_prob': probs.round(4),
+    })
+    stats = _minute_stats(chunk, probs) if LABEL_COL in chunk.columns else None
+    return curves, stats
+
+
+def build_tasks(path, chunk_bytes):
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(path)
+        names = set(pf.schema_arrow.names)
+        columns = KEY_COLS + FEATURE_COLS + ([LABEL_COL] if LABEL_COL in names else [])
+        return [('parquet', path, i, None, columns) for i in range(pf.num_row_groups)]
+
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    missing = [c for c in KEY_COLS + FEATURE_COLS if c not in header]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {missing}")
+    columns = KEY_COLS + FEATURE_COLS + ([LABEL_COL] if LABEL_COL in header else [])
+    return [('csv', path, piece, header, columns) for piece in csv_chunks(path, chunk_bytes)]
+
+
+def print_drift_report(stats):
+    stats = stats.sort_index()
+    print("\n📈 Drift report (per minute)")
+    print(f"{'min':>5} {'rows':>10} {'mean prob':>10} {'blue win%':>10} {'gap':>8} {'acc':>8} {'log loss':>9}")
+    for minute, row in stats.iterrows():
+        n = row['rows']
+        mean_prob = row['prob_sum'] / n
+        win_rate = row['label_sum'] / n
+        print(f"{minute:>5} {int(n):>10} {mean_prob:>10.3f} {win_rate:>10.3f} "
+              f"{mean_prob - win_rate:>+8.3f} {row['correct'] / n:>8.2%} {row['log_loss_sum'] / n:>9.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk offline win-probability scoring")
+    parser.add_argument('input', help="CSV or .parquet dataset")
+    parser.add_argument('-o', '--output', help="curves CSV (default: <input>_curves.csv)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--chunk-mb', type=int, default=CHUNK_BYTES >> 20, help="CSV piece size in MB")
+    parser.add_argument('--model', default=MODEL_FILE)
+    parser.add_argument('--scaler', default=SCALER_FILE)
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.input)[0] + '_curves.csv'
+    tasks = build_tasks(args.input, args.chunk_mb << 20)
+
+    print(f"🎮 Scoring {args.input} ({len(tasks)} pieces, {args.workers} workers)")
+    started = time.perf_counter()
+    total_rows = 0
+    stats = None
+
+    with Pool(args.workers, initializer=_init_worker, initargs=(args.model, args.scaler)) as pool, \
+            open(output, 'w', newline='') as out:
+        header = True
+        # imap keeps input order, so each match's curve stays contiguous
+        for curves, piece_stats in pool.imap(score_piece, tasks):
+            curves.to_csv(out, header=header, index=False)
+            header = False
+            total_rows += len(curves)
+            if piece_stats is not None:
+                stats = piece_stats if stats is None else stats.add(piece_stats, fill_value=0)
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ Scored {total_rows:,} rows in {elapsed:.2f}s ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    print(f"📁 Saved to: {output}")
+
+    if stats is not None:
+        print_drift_report(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#build tip_table.json (see tip_table.py)
+#
+#   python build_tip_table.py                    # templates only, no network
+#   python build_tip_table.py --llm --workers 8  # one LLM call per cell, templates on failure
+#
+#the template build is deterministic and is what ships with the overlay; the
+#--llm build needs OPENROUTER_API_KEY (.env works) and makes one request per
+#grid cell, so expect a few thousand calls.
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tip_table import (DRAGON_CLAMP, GOLD_EDGES, MINUTES, PROB_EDGES, TABLE_FILE, TOWER_CLAMP,
+                       cell_index, grid_shape, save_table)
+
+# ---------- CONFIG ----------
+TIPS_MODEL = "anthropic/claude-3.5-haiku"
+# ----------------------------
+
+
+def band_mid(band, edges, low, high):
+    """Representative value of a band; low/high close the two outer bands"""
+    bounds = (low,) + tuple(edges) + (high,)
+    return (bounds[band] + bounds[band + 1]) / 2
+
+
+def describe(minute, prob_band, gold_band, tower_diff, dragon_diff):
+    return {
+        'minute': minute,
+        'prob': band_mid(prob_band, PROB_EDGES, 0.0, 1.0),
+        'gold': band_mid(gold_band, GOLD_EDGES, GOLD_EDGES[0] - 2000, GOLD_EDGES[-1] + 2000),
+        'towers': tower_diff,
+        'dragons': dragon_diff,
+    }
+
+
+# ---------- Templates ----------
+PHASE = {'early': range(0, 15), 'mid': range(15, 30), 'late': range(30, 999)}
+
+LEAD_LINES = {
+    ('early', True): "Press your lead: invade and deny enemy jungle camps.",
+    ('early', False): "Play safe, farm up and wait for your scaling.",
+    ('mid', True): "Group with the wave and take the next tower.",
+    ('mid', False): "Avoid 5v5s; catch side-laners and clear waves.",
+    ('late', True): "Take Baron with vision, then siege as five.",
+    ('late', False): "Defend under towers and look for one good pick.",
+}
+
+
+def gold_line(gold, towers):
+    if gold >= 3000:
+        return "Spend the gold lead: buy Control Wards, force fights."
+    if gold <= -3000:
+        return "Behind on gold: stop trading, farm safe side waves."
+    if towers > 0:
+        return "Rotate to the lane where you already broke a tower."
+    if towers < 0:
+        return "Hold the broken lane with waves; don't face-check."
+    return "Even gold: play around your jungler's side."
+
+
+def objective_line(minute, dragons, winning):
+    # the grid only has the dragon difference, not either team's count
+    dragon_lead = abs(dragons) >= 2 and minute >= 20
+    if dragon_lead and dragons > 0:
+        return "Dragon lead: set up vision early and take the next one."
+    if dragon_lead:
+        return "Enemy leads dragons: contest the next one as five."
+    if minute >= 20:
+        return "Ward Baron pit before it spawns; trade if they start it." if winning else \
+               "Sweep Baron vision; don't let them start it for free."
+    if dragons < 0:
+        return "Trade Herald or top towers for the next dragon."
+    return "Push bot before dragon spawns so your duo can move first."
+
+
+def template_tip(minute, prob, gold, towers, dragons):
+    winning = prob > 0.5
+    phase = next(name for name, minutes in PHASE.items() if minute in minutes)
+    return "\n".join([
+        "1. " + LEAD_LINES[(phase, winning)],
+        "2. " + gold_line(gold, towers),
+        "3. " + objective_line(minute, dragons, winning),
+    ])
+
+
+# ---------- LLM ----------
+def llm_prompt(minute, prob, gold, towers, dragons):
+    state = "WINNING" if prob > 0.5 else "LOSING"
+    return f"""You are a League of Legends analyst. At {minute} minutes, YOUR team is {state} with about {prob:.0%} win probability.
+
+Your team vs Enemy:
+- Gold difference: {gold:+.0f}
+- Tower difference: {towers:+d}
+- Dragon difference: {dragons:+d}
+
+Give 3 SHORT, actionable tips (10 words each max) for YOUR team. Be specific and strategic."""
+
+
+def make_llm(model):
+    from dotenv import load_dotenv
+    from openai import OpenAI
+    load_dotenv()
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        return None
+    client = OpenAI(base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"), api_key=api_key)
+
+    def ask(state):
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": llm_prompt(**state)}],
+                max_tokens=100,
+                temperature=0.7,
+                timeout=30,
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            print(f"⚠ {state}: {str(e)[:50]}")
+            return None
+    return ask
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute tips for every coarse game state")
+    parser.add_argument('--out', default=TABLE_FILE)
+    parser.add_argument('--llm', action='store_true', help="ask the LLM for every cell (needs OPENROUTER_API_KEY)")
+    parser.add_argument('--model', default=TIPS_MODEL)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    cells = list(itertools.product(
+        MINUTES, range(len(PROB_EDGES) + 1), range(len(GOLD_EDGES) + 1),
+        range(-TOWER_CLAMP, TOWER_CLAMP + 1), range(-DRAGON_CLAMP, DRAGON_CLAMP + 1),
+    ))
+    shape = grid_shape()
+    print(f"📊 {len(cells)} cells ({' x '.join(map(str, shape))})")
+
+    states = {cell_index(*c): describe(*c) for c in cells}
+    tips = {index: template_tip(**state) for index, state in states.items()}
+
+    if args.llm:
+        ask = make_llm(args.model)
+        if ask is None:
+            print("✗ OPENROUTER_API_KEY not set; keeping the template tips")
+        else:
+            started = time.time()
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                answers = dict(zip(states, pool.map(ask, states.values())))
+            filled = 0
+            for index, answer in answers.items():
+                if answer:
+                    tips[index] = answer
+                    filled += 1
+            print(f"🤖 {filled}/{len(cells)} cells from {args.model} in {time.time() - started:.0f}s")
+
+    unique = save_table(tips, args.out)
+    print(f"💾 Saved {args.out}: {unique} distinct tips, {os.path.getsize(args.out) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#coaching view: poll every player's Live Client at once, publish one team state
+#
+#   python coach_aggregator.py https://10.0.0.11:2999 https://10.0.0.12:2999 ...
+#   python coach_aggregator.py --seats-file seats.txt      # one URL per line
+#
+#   python mock_live_client.py --seats 5 --speed 10        # local test rig
+#   python coach_aggregator.py http://127.0.0.1:{2999..3003}
+#
+#each round polls every seat concurrently (asyncio + one keep-alive poller per
+#seat in a worker thread), with a per-seat timeout so one slow machine never
+#holds up the others. The freshest seat gives the team view; win probability
+#(per seat's view) and death risk (per player) are scored in one batch each.
+#
+#published like live_server.py (same Broadcaster / handler):
+#   GET  http://127.0.0.1:8766/state   {"status", "game_time", "player_team", "blue", "red",
+#                                       "blue_win_prob", "player_win_prob", "seats": [...],
+#                                       "timings_ms", "updated_at", "subscribers"}
+#   GET  ws://127.0.0.1:8766/ws
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+
+from live_client import LiveClientPoller, player_name
+from live_engine import TimingStats, parse_snapshot
+from live_events import EventTracker
+from live_server import HOST, Broadcaster, make_handler
+from live_stats import create_features
+from win_model import FEATURE_COLS, load_live_model, predict_blue_proba
+
+# ---------- CONFIG ----------
+PORT = 8766
+ROUND_SEC = 1.0            # one poll of every seat per round
+SEAT_TIMEOUT_SEC = 0.8     # a seat slower than this is reported stale for the round
+# ----------------------------
+
+
+class Seat:
+    """One player's Live Client and what we last heard from it"""
+
+    def __init__(self, url, timeout=SEAT_TIMEOUT_SEC):
+        self.url = url
+        self.poller = LiveClientPoller(base_url=url, timeout=timeout)
+        self.tracker = EventTracker()
+        self.pending = None        # poll still running in its thread (timed out last round)
+        self.next_poll = 0.0       # absent clients are retried on the poller's backoff
+        self.snapshot = None       # last live_engine.LiveSnapshot
+        self.polled_at = None
+        self.status = 'absent'
+        self.timing = TimingStats(budget_ms=SEAT_TIMEOUT_SEC * 1000)
+
+    async def poll(self, timeout):
+        """Refresh snapshot/status; never raises and never waits past timeout"""
+        now = time.monotonic()
+        if self.pending is None:
+            if now < self.next_poll:
+                return
+            self.pending = asyncio.ensure_future(asyncio.to_thread(self.poller.poll))
+        try:
+            # shield: on timeout the request keeps its thread; the next round picks it up
+            data = await asyncio.wait_for(asyncio.shield(self.pending), timeout)
+        except asyncio.TimeoutError:
+            self.status = 'timeout'
+            return
+        finally:
+            if self.pending.done():
+                self.pending = None
+        self.timing.add((time.monotonic() - now) * 1000)
+
+        self.status = self.poller.state
+        if data is None:
+            # gone or between games: drop the old game so it stops counting as live
+            self.snapshot = None
+            self.polled_at = None
+            self.next_poll = time.monotonic() + self.poller.interval()
+            return
+        self.snapshot = parse_snapshot(data, self.tracker, self.poller.state)
+        self.polled_at = time.time()
+
+
+class Aggregator:
+    def __init__(self, urls, timeout=SEAT_TIMEOUT_SEC):
+        self.seats = [Seat(url, timeout) for url in urls]
+        self.timeout = timeout
+        self.win_model = load_live_model()
+        self.death_model = None
+        try:
+            from risk_score import live_risk_score
+            self.death_model = live_risk_score.load_model(live_risk_score.MODEL_PATH)
+        except Exception as e:
+            print(f"⚠ Death-risk model unavailable: {e}")
+        self.timing = {'round': TimingStats(), 'models': TimingStats()}
+
+    async def round(self):
+        """Poll every seat concurrently, score them in batches, return the team state"""
+        t0 = time.perf_counter()
+        await asyncio.gather(*(seat.poll(self.timeout) for seat in self.seats))
+        t1 = time.perf_counter()
+
+        live = [seat for seat in self.seats if seat.snapshot is not None]
+        win_probs = self.score_win(live)
+        risks = self.score_death(live)
+        t2 = time.perf_counter()
+        self.timing['round'].add((t1 - t0) * 1000)
+        self.timing['models'].add((t2 - t1) * 1000)
+
+        state = {'status': 'waiting', 'updated_at': time.time(),
+                 'timings_ms': {'poll_round': (t1 - t0) * 1000, 'models': (t2 - t1) * 1000}}
+        scored = {id(seat): (win_prob, risk) for seat, win_prob, risk in zip(live, win_probs, risks)}
+        seats_out = []
+        for seat in self.seats:
+            seat_state = {'url': seat.url, 'status': seat.status}
+            seats_out.append(seat_state)
+            if id(seat) not in scored:
+                continue
+            win_prob, risk = scored[id(seat)]
+            snapshot = seat.snapshot
+            seat_state.update({
+                'player': player_name(snapshot.player or snapshot.active) or None,
+                'champion': (snapshot.player or {}).get('championName'),
+                'team': snapshot.player_team,
+                'game_time': snapshot.game_time,
+                'age_sec': time.time() - seat.polled_at,
+                'blue_win_prob': win_prob,
+                'death_risk': risk,
+                'hp': (snapshot.active.get('championStats') or {}).get('currentHealth'),
+                'gold': snapshot.active.get('currentGold'),
+                'poll_p99_ms': seat.timing.summary().get('p99_ms'),
+            })
+        state['seats'] = seats_out
+
+        if live:
+            # every seat sees the same game; the one furthest along is the team view
+            index = max(range(len(live)), key=lambda i: live[i].snapshot.game_time)
+            freshest = live[index].snapshot
+            blue_prob = win_probs[index]
+            teams = {s.snapshot.player_team for s in live}
+            team = teams.pop() if len(teams) == 1 else None   # None: seats on both sides
+            state.update({
+                'status': 'live',
+                'game_time': freshest.game_time,
+                'player_team': team,
+                'blue': freshest.blue,
+                'red': freshest.red,
+                'blue_win_prob': blue_prob,
+                'player_win_prob': None if team is None else (blue_prob if team == 'ORDER' else 1.0 - blue_prob),
+            })
+        return state
+
+    def score_win(self, live):
+        """P(blue wins) for every seat's view in one matrix product"""
+        if not live:
+            return []
+        X = np.array([[create_features(s.snapshot.blue, s.snapshot.red)[col] for col in FEATURE_COLS]
+                      for s in live], dtype=np.float64)
+        return [float(p) for p in predict_blue_proba(X, self.win_model)]
+
+    def score_death(self, live):
+        """Death risk for every seat's player in one scaler/model call"""
+        if self.death_model is None or not live:
+            return [None] * len(live)
+        from risk_score.live_risk_score import player_features, predict_risk_batch
+        feats = [player_features(s.snapshot.active, s.snapshot.player, verbose=False) for s in live]
+        try:
+            return predict_risk_batch(*self.death_model, feats)
+        except Exception as e:
+            print(f"✗ Death-risk batch failed: {e}")
+            return [None] * len(live)
+
+    def stop(self):
+        for seat in self.seats:
+            seat.poller.stop()
+
+
+async def run(aggregator, broadcaster, round_sec=ROUND_SEC):
+    while True:
+        started = time.monotonic()
+        broadcaster.publish(await aggregator.round())
+        await asyncio.sleep(max(0.0, round_sec - (time.monotonic() - started)))
+
+
+def read_seats(path):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Poll several Live Clients and publish one team view")
+    parser.add_argument('urls', nargs='*', help="Live Client base URLs, one per seat")
+    parser.add_argument('--seats-file', help="file with one Live Client URL per line")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--round-sec', type=float, default=ROUND_SEC)
+    parser.add_argument('--timeout', type=float, default=SEAT_TIMEOUT_SEC, help="per-seat poll timeout (s)")
+    args = parser.parse_args()
+
+    urls = list(args.urls) + (read_seats(args.seats_file) if args.seats_file else [])
+    if not urls:
+        parser.error("give at least one Live Client URL (or --seats-file)")
+
+    broadcaster = Broadcaster()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(broadcaster))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    aggregator = Aggregator(urls, timeout=args.timeout)
+    print(f"🎮 Coaching {len(urls)} seats every {args.round_sec:g}s (timeout {args.timeout:g}s)")
+    print(f"📡 Serving http://{args.host}:{args.port}/state and ws://{args.host}:{args.port}/ws")
+    try:
+        asyncio.run(run(aggregator, broadcaster, args.round_sec))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        aggregator.stop()
+        server.shutdown()
+        print(f"📊 round {aggregator.timing['round'].summary()}")
+        print(f"📊 models {aggregator.timing['models'].summary()}")
+
+
+if __name__ == "__main__":
+    main()
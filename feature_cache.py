@@ -0,0 +1,141 @@
+#caches the parsed training CSV as memory-mapped .npy files so repeated training
+#runs skip CSV parsing entirely
+#
+#   X          float32 (rows x features)   <key>.X.npy
+#   y          int8    (rows,)             <key>.y.npy
+#   match_ids  fixed-width str (rows,)     <key>.ids.npy
+#   timestamps int32   (rows,)             <key>.ts.npy
+#
+#the key is a hash of the CSV bytes + feature list, so editing either one just
+#produces a new cache entry
+
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+# ---------- CONFIG ----------
+CACHE_DIR = '.feature_cache'
+CACHE_VERSION = 1          # bump if the on-disk layout changes
+HASH_CHUNK = 1 << 20
+# ----------------------------
+
+FeatureMatrix = namedtuple('FeatureMatrix', ['X', 'y', 'match_ids', 'timestamps', 'key'])
+
+
+def _file_fingerprint(path):
+    st = os.stat(path)
+    return f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def cache_key(csv_path, feature_cols, label_col, cache_dir=CACHE_DIR):
+    """
+    sha256 of the CSV contents + feature list.
+
+    Hashing is skipped when the file's size/mtime match the last hash we did,
+    so a warm lookup costs one stat() call.
+    """
+    fingerprints_file = os.path.join(cache_dir, 'fingerprints.json')
+    fingerprints = {}
+    if os.path.exists(fingerprints_file):
+        with open(fingerprints_file) as f:
+            fingerprints = json.load(f)
+
+    fingerprint = _file_fingerprint(csv_path)
+    content_hash = fingerprints.get(fingerprint)
+
+    if content_hash is None:
+        h = hashlib.sha256()
+        with open(csv_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+                h.update(chunk)
+        content_hash = h.hexdigest()
+
+        # only remember the latest fingerprint per file
+        prefix = os.path.abspath(csv_path) + ':'
+        fingerprints = {k: v for k, v in fingerprints.items() if not k.startswith(prefix)}
+        fingerprints[fingerprint] = content_hash
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(fingerprints_file + '.tmp', 'w') as f:
+            json.dump(fingerprints, f)
+        os.replace(fingerprints_file + '.tmp', fingerprints_file)
+
+    spec = json.dumps({
+        'version': CACHE_VERSION,
+        'features': list(feature_cols),
+        'label': label_col,
+    }, sort_keys=True)
+    return hashlib.sha256((content_hash + spec).encode()).hexdigest()[:16]
+
+
+def _paths(cache_dir, key):
+    base = os.path.join(cache_dir, key)
+    return {
+        'X': base + '.X.npy',
+        'y': base + '.y.npy',
+        'ids': base + '.ids.npy',
+        'ts': base + '.ts.npy',
+        'meta': base + '.json',
+    }
+
+
+def _build(csv_path, feature_cols, label_col, paths):
+    import pandas as pd
+
+    data = pd.read_csv(csv_path)
+
+    arrays = {
+        'X': data[list(feature_cols)].to_numpy(dtype=np.float32),
+        'y': data[label_col].to_numpy(dtype=np.int8),
+        'ids': data['match_id'].astype(str).to_numpy(dtype=str),
+        'ts': data['timestamp_min'].to_numpy(dtype=np.int32),
+    }
+
+    # write every array under a temp name first; the meta file is written last
+    # and marks the entry as complete
+    for name, arr in arrays.items():
+        tmp_path = paths[name] + '.tmp'
+        out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=arr.dtype, shape=arr.shape)
+        out[...] = arr
+        out.flush()
+        del out
+        os.replace(tmp_path, paths[name])
+
+    with open(paths['meta'], 'w') as f:
+        json.dump({
+            'source': os.path.abspath(csv_path),
+            'features': list(feature_cols),
+            'label': label_col,
+            'rows': int(len(data)),
+        }, f)
+
+
+def load_feature_matrix(csv_path, feature_cols, label_col='blue_win', cache_dir=CACHE_DIR):
+    """
+    Return a FeatureMatrix of read-only memmaps for csv_path, building the
+    cache entry on first use.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    key = cache_key(csv_path, feature_cols, label_col, cache_dir)
+    paths = _paths(cache_dir, key)
+
+    if not os.path.exists(paths['meta']):
+        print(f"📦 Building feature cache {key} from {csv_path}")
+        _build(csv_path, feature_cols, label_col, paths)
+
+    return FeatureMatrix(
+        X=np.load(paths['X'], mmap_mode='r'),
+        y=np.load(paths['y'], mmap_mode='r'),
+        match_ids=np.load(paths['ids'], mmap_mode='r'),
+        timestamps=np.load(paths['ts'], mmap_mode='r'),
+        key=key,
+    )
+
+
+if __name__ == "__main__":
+    from ModelTraining import DATA_FILE, FEATURE_COLS
+
+    fm = load_feature_matrix(DATA_FILE, FEATURE_COLS)
+    print(f"✓ {DATA_FILE} -> {CACHE_DIR}/{fm.key}.*  X={fm.X.shape} {fm.X.dtype}, y={fm.y.shape}")
@@ -0,0 +1,209 @@
+#shared poller for the League Live Client Data API (https://127.0.0.1:2999)
+#
+#one keep-alive session instead of a new TLS connection per request, and an
+#interval that follows what's happening in the game:
+#   fight/objective / near a checkpoint  -> fast
+#   normal play                -> normal
+#   dead, paused, loading      -> slow
+#   client not running         -> exponential backoff
+#
+#   poller = LiveClientPoller(checkpoints_min=[10, 20, 30, 40])
+#   while True:
+#       data = poller.poll()      # dict, or None if the client isn't there
+#       ...
+#       poller.sleep()
+
+import os
+import threading
+import time
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# ---------- CONFIG ----------
+LIVE_CLIENT_URL = os.getenv("LIVE_CLIENT_URL", "https://127.0.0.1:2999")
+INTERVALS = {              # seconds between polls per game state
+    'fight': 0.5,
+    'checkpoint': 0.5,
+    'live': 2.0,
+    'dead': 4.0,
+    'paused': 5.0,
+    'loading': 5.0,
+    'absent': 2.0,         # first retry; doubles per failure
+}
+MAX_BACKOFF = 30.0
+FIGHT_WINDOW_SEC = 10      # a kill/objective this recent counts as "in a fight"
+CHECKPOINT_LEAD_SEC = 30   # poll fast this long before a checkpoint minute
+# ----------------------------
+
+# events that move the win probability enough to poll (and re-score) faster
+FIGHT_EVENTS = {
+    'ChampionKill', 'TurretKilled', 'InhibKilled',
+    'DragonKill', 'HeraldKill', 'BaronKill',
+}
+
+
+def player_name(player):
+    """Name a player entry is known by (field differs across client versions)"""
+    return (
+        player.get("summonerName")
+        or player.get("riotId")
+        or player.get("riotIdGameName")
+    )
+
+
+def all_players(data):
+    players = data.get("allPlayers", [])
+    if isinstance(players, dict):
+        players = list(players.values())
+    return players
+
+
+def find_active_player(data):
+    """The allPlayers entry for the local player, or None"""
+    active = data.get("activePlayer", {}) or {}
+    names = {active.get(k) for k in ("summonerName", "riotId", "riotIdGameName")} - {None}
+    if not names:
+        return None
+    for player in all_players(data):
+        if names & {player.get(k) for k in ("summonerName", "riotId", "riotIdGameName")}:
+            return player
+    return None
+
+
+class LiveClientPoller:
+    def __init__(self, base_url=LIVE_CLIENT_URL, timeout=1.0, checkpoints_min=(), intervals=None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.checkpoints_sec = [m * 60 for m in checkpoints_min]
+        self.intervals = dict(INTERVALS, **(intervals or {}))
+
+        # keep-alive: one pooled connection reused for every poll
+        self.session = requests.Session()
+        self.session.verify = False
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.state = 'absent'
+        self.failures = 0
+        self.last_error = None       # exception, or response text that wasn't JSON
+        self.last_game_time = None
+        self.fetch_timings = {}      # {'http': ms, 'decode': ms} of the last successful fetch
+        self.stop_event = threading.Event()
+
+    def fetch(self, endpoint='allgamedata', params=None):
+        """
+        GET /liveclientdata/<endpoint>. Returns (ok, json_or_text) like the old
+        safe_get_live_json (ok is False for error statuses and non-JSON bodies);
+        connection errors are raised after being recorded.
+        """
+        started = time.perf_counter()
+        try:
+            r = self.session.get(
+                f"{self.base_url}/liveclientdata/{endpoint}",
+                params=params,
+                timeout=self.timeout
+            )
+            r.raise_for_status()
+        except requests.HTTPError as e:
+            # the client is up but not game-ready (404 on the loading screen, 503):
+            # poll at the loading rate instead of backing off
+            self.failures = 0
+            self.state = 'loading'
+            self.last_error = e
+            return False, e.response.text
+        except requests.RequestException as e:
+            self.failures += 1
+            self.state = 'absent'
+            self.last_error = e
+            self.last_game_time = None
+            raise
+
+        self.failures = 0
+        received = time.perf_counter()
+        try:
+            data = r.json()
+        except ValueError:
+            self.state = 'loading'
+            self.last_error = r.text
+            return False, r.text
+        self.fetch_timings = {'http': (received - started) * 1000,
+                              'decode': (time.perf_counter() - received) * 1000}
+
+        if endpoint == 'allgamedata':
+            self.classify(data)
+        return True, data
+
+    def poll(self):
+        """allgamedata as a dict, or None when the client is absent or not game-ready"""
+        try:
+            ok, data = self.fetch()
+        except requests.RequestException:
+            return None
+        if not ok or not isinstance(data, dict):
+            self.state = 'loading'
+            return None
+        return data
+
+    def classify(self, data):
+        """Work out the game state that picks the next poll interval"""
+        if not isinstance(data, dict):
+            self.state = 'loading'
+            return self.state
+
+        game_time = data.get('gameData', {}).get('gameTime', 0) or 0
+        previous = self.last_game_time
+        self.last_game_time = game_time
+
+        if game_time <= 0 or not all_players(data):
+            self.state = 'loading'
+        elif previous is not None and game_time == previous:
+            self.state = 'paused'
+        elif (find_active_player(data) or {}).get('isDead'):
+            self.state = 'dead'
+        elif self._recent_fight(data, game_time):
+            self.state = 'fight'
+        elif any(0 <= cp - game_time <= CHECKPOINT_LEAD_SEC for cp in self.checkpoints_sec):
+            self.state = 'checkpoint'
+        else:
+            self.state = 'live'
+        return self.state
+
+    @staticmethod
+    def _recent_fight(data, game_time):
+        # events are in time order, so walk back only as far as the window
+        for event in reversed(data.get('events', {}).get('Events', [])):
+            if game_time - event.get('EventTime', 0) > FIGHT_WINDOW_SEC:
+                return False
+            if event.get('EventName') in FIGHT_EVENTS:
+                return True
+        return False
+
+    def interval(self):
+        if self.state == 'absent':
+            backoff = self.intervals['absent'] * 2 ** max(0, self.failures - 1)
+            return min(MAX_BACKOFF, backoff)
+        return self.intervals[self.state]
+
+    def sleep(self):
+        """Wait until the next poll is due; returns early after stop()"""
+        self.stop_event.wait(self.interval())
+
+    def stop(self):
+        self.stop_event.set()
+        self.session.close()
+
+
+if __name__ == "__main__":
+    poller = LiveClientPoller()
+    while True:
+        started = time.perf_counter()
+        data = poller.poll()
+        took_ms = (time.perf_counter() - started) * 1000
+        game_time = data.get('gameData', {}).get('gameTime', 0) if data else 0
+        print(f"{poller.state:>10}  t={game_time:7.1f}s  poll={took_ms:6.1f}ms  next in {poller.interval():.1f}s")
+        poller.sleep()
@@ -0,0 +1,243 @@
+#one poll, one parse, many models
+#
+#LiveEngine polls the Live Client once per tick, parses the payload once into
+#a LiveSnapshot, then runs every registered stage on it (win probability,
+#death risk, ...). Each stage has a latency budget and keeps rolling timing
+#stats, so adding a model means adding a stage, not another poller.
+#
+#   engine = LiveEngine(stages=[WinProbabilityStage(LiveScorer(load_live_model()))])
+#   engine.add_stage(DeathRiskStage.load())     # None is ignored
+#   while True:
+#       snapshot = engine.tick()                # None while there's no game
+#       if snapshot is not None:
+#           snapshot.predictions['blue_win_prob'], snapshot.timings_ms
+#       engine.poller.sleep()
+
+import abc
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from live_client import LiveClientPoller, find_active_player
+from live_events import EventTracker
+from live_stats import calculate_stats, create_features, get_player_team
+
+# ---------- CONFIG ----------
+STATS_WINDOW = 300         # ticks of history behind the rolling percentiles
+WIN_BUDGET_MS = 1.0
+DEATH_RISK_BUDGET_MS = 5.0
+# ----------------------------
+
+
+@dataclass
+class LiveSnapshot:
+    """One allgamedata payload, parsed once and shared by every stage"""
+    game_time: float
+    blue: dict                      # team stats (live_stats.calculate_stats)
+    red: dict
+    new_events: list                # events first seen this tick
+    active: dict                    # activePlayer: hp/gold only exist for the local player
+    player: Optional[dict]          # the local player's allPlayers entry (None when spectating)
+    player_team: str                # 'ORDER' (blue) / 'CHAOS' (red)
+    poller_state: str
+    raw: dict
+    predictions: dict = field(default_factory=dict)   # stage name -> value (None if it failed)
+    timings_ms: dict = field(default_factory=dict)    # 'poll' ('http', 'decode'), 'parse', stage names
+
+    @property
+    def player_win_prob(self):
+        blue_prob = self.predictions.get('blue_win_prob')
+        if blue_prob is None:
+            return None
+        return blue_prob if self.player_team == 'ORDER' else 1.0 - blue_prob
+
+
+def parse_snapshot(data, tracker, poller_state='live'):
+    blue_stats, red_stats, new_events = calculate_stats(data, tracker)
+    player = find_active_player(data)
+    return LiveSnapshot(
+        game_time=data.get('gameData', {}).get('gameTime', 0) or 0,
+        blue=blue_stats,
+        red=red_stats,
+        new_events=new_events,
+        active=data.get('activePlayer', {}) or {},
+        player=player,
+        player_team=get_player_team(data, player),
+        poller_state=poller_state,
+        raw=data,
+    )
+
+
+class TimingStats:
+    """Rolling latency window with a budget"""
+
+    def __init__(self, budget_ms=None, window=STATS_WINDOW):
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=window)
+        self.calls = 0
+        self.over_budget = 0
+
+    def add(self, ms):
+        self.samples.append(ms)
+        self.calls += 1
+        if self.budget_ms is not None and ms > self.budget_ms:
+            self.over_budget += 1
+            return False
+        return True
+
+    def summary(self):
+        if not self.samples:
+            return {'calls': 0}
+        ordered = sorted(self.samples)
+        n = len(ordered)
+        return {
+            'calls': self.calls,
+            'mean_ms': sum(ordered) / n,
+            'p50_ms': ordered[n // 2],
+            'p99_ms': ordered[min(n - 1, int(n * 0.99))],
+            'max_ms': ordered[-1],
+            'budget_ms': self.budget_ms,
+            'over_budget': self.over_budget,
+        }
+
+
+class Stage(abc.ABC):
+    """A model run on every snapshot; subclasses set name/budget_ms and implement run()"""
+    name = 'stage'
+    budget_ms = None
+
+    def __init__(self):
+        self.timing = TimingStats(self.budget_ms)
+        self.errors = 0
+        self.warned = False
+
+    @abc.abstractmethod
+    def run(self, snapshot):
+        """Prediction for snapshot (None if it can't be made)"""
+
+    def __call__(self, snapshot):
+        started = time.perf_counter()
+        try:
+            value = self.run(snapshot)
+        except Exception as e:
+            value = None
+            self.errors += 1
+            if self.errors == 1:
+                print(f"✗ {self.name} stage failed: {e}")
+        ms = (time.perf_counter() - started) * 1000
+        if not self.timing.add(ms) and not self.warned:
+            # once per stage; the running count is in timing.summary()
+            print(f"⚠ {self.name} took {ms:.1f}ms (budget {self.budget_ms}ms)")
+            self.warned = True
+        return value, ms
+
+
+class WinProbabilityStage(Stage):
+    name = 'blue_win_prob'
+    budget_ms = WIN_BUDGET_MS
+
+    def __init__(self, scorer):
+        super().__init__()
+        self.scorer = scorer   # win_model.LiveScorer
+
+    def run(self, snapshot):
+        self.scorer.set_features(create_features(snapshot.blue, snapshot.red))
+        return self.scorer.score()
+
+
+class DeathRiskStage(Stage):
+    name = 'death_risk'
+    budget_ms = DEATH_RISK_BUDGET_MS
+
+    def __init__(self, model, verbose=False):
+        super().__init__()
+        self.scaler, self.clf, self.feature_cols = model
+        self.verbose = verbose        # player_features' [debug] lines, every tick
+        self.last_features = None
+        self.warned_features = False
+
+    @classmethod
+    def load(cls, model_file=None):
+        """Stage for risk_score/death_model.pkl, or None if it can't be loaded"""
+        try:
+            from risk_score import live_risk_score
+            return cls(live_risk_score.load_model(model_file or live_risk_score.MODEL_PATH))
+        except Exception as e:
+            print(f"⚠ Death-risk model unavailable: {e}")
+            return None
+
+    def run(self, snapshot):
+        from risk_score.live_risk_score import player_features, predict_risk
+        feats = self.last_features = player_features(snapshot.active, snapshot.player, verbose=self.verbose)
+        if feats is None:
+            if not self.verbose and not self.warned_features:
+                # spectating, or the scoreboard isn't linked yet; this repeats every tick
+                print(f"⚠ {self.name}: no features for the local player yet")
+                self.warned_features = True
+            return None
+        return predict_risk(self.scaler, self.clf, self.feature_cols, feats)
+
+
+class LiveEngine:
+    def __init__(self, poller=None, stages=(), recorder=None):
+        self.poller = poller if poller is not None else LiveClientPoller()
+        self.tracker = EventTracker()
+        self.stages = []
+        self.recorder = recorder          # live_recorder.LiveRecorder, optional
+        self.subscribers = []
+        self.timing = {'poll': TimingStats(), 'parse': TimingStats()}
+        for stage in stages:
+            self.add_stage(stage)
+
+    def add_stage(self, stage):
+        if stage is not None:
+            self.stages.append(stage)
+        return stage
+
+    def subscribe(self, callback):
+        """callback(snapshot) after every tick; snapshot is None while there's no game"""
+        self.subscribers.append(callback)
+
+    def tick(self):
+        """Poll once and run every stage; returns the LiveSnapshot or None"""
+        t0 = time.perf_counter()
+        data = self.poller.poll()
+        t1 = time.perf_counter()
+        self.timing['poll'].add((t1 - t0) * 1000)
+
+        snapshot = None
+        if data is not None:
+            snapshot = parse_snapshot(data, self.tracker, self.poller.state)
+            t2 = time.perf_counter()
+            self.timing['parse'].add((t2 - t1) * 1000)
+            snapshot.timings_ms['poll'] = (t1 - t0) * 1000
+            snapshot.timings_ms.update(self.poller.fetch_timings)   # poll split into http + decode
+            snapshot.timings_ms['parse'] = (t2 - t1) * 1000
+            if self.recorder is not None:
+                self.recorder.record(data)
+
+            for stage in self.stages:
+                snapshot.predictions[stage.name], snapshot.timings_ms[stage.name] = stage(snapshot)
+
+        for callback in self.subscribers:
+            callback(snapshot)
+        return snapshot
+
+    def run(self):
+        """tick() until poller.stop()"""
+        while not self.poller.stop_event.is_set():
+            self.tick()
+            self.poller.sleep()
+
+    def stop(self):
+        self.poller.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def stats(self):
+        """{'poll': {...}, 'parse': {...}, <stage name>: {...}} rolling timing summaries"""
+        summary = {name: timing.summary() for name, timing in self.timing.items()}
+        for stage in self.stages:
+            summary[stage.name] = dict(stage.timing.summary(), errors=stage.errors)
+        return summary
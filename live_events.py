@@ -0,0 +1,192 @@
+#incremental processing of the Live Client event feed
+#
+#allgamedata returns every event since the game started, so rescanning the
+#whole list each tick gets slower as the game goes on. EventTracker remembers
+#the last EventID it handled and keeps running per-team counters, so each
+#tick only touches the events that are new since the previous one.
+#
+#counters follow data_collector.py's meaning: towers/inhibs are ENEMY
+#structures a team destroyed, dragons/heralds/barons are monsters it took
+#
+#KillIndex does the same for death labels (risk_score/realtime_data_collection.py):
+#each ChampionKill is indexed once by EventID into a sorted list of death times
+#per victim, so "did X die in [t, t+10]" is a bisect instead of a log scan
+
+from bisect import bisect_left, insort
+
+from live_client import all_players
+
+TEAMS = ('ORDER', 'CHAOS')   # ORDER = blue, CHAOS = red
+COUNTERS = ('kills', 'towers', 'inhibs', 'dragons', 'heralds', 'barons')
+
+MONSTER_EVENTS = {
+    'DragonKill': 'dragons',
+    'HeraldKill': 'heralds',
+    'BaronKill': 'barons',
+}
+
+# structure names carry the OWNING team: Turret_T1_* / Barracks_T1_* are blue's
+STRUCTURE_OWNER = {'_T1_': 'ORDER', '_T2_': 'CHAOS'}
+
+
+def _other(team):
+    return 'CHAOS' if team == 'ORDER' else 'ORDER'
+
+
+def _structure_owner(name):
+    for marker, owner in STRUCTURE_OWNER.items():
+        if marker in (name or ''):
+            return owner
+    return None
+
+
+class EventTracker:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.counts = {team: dict.fromkeys(COUNTERS, 0) for team in TEAMS}
+        self.last_event_id = -1
+        self.processed = 0          # how many list entries we've consumed
+        self.last_game_time = 0
+        self.name_to_team = {}
+
+    def _learn_teams(self, data):
+        for player in all_players(data):
+            team = player.get('team')
+            for key in ('summonerName', 'riotId', 'riotIdGameName'):
+                name = player.get(key)
+                if name:
+                    self.name_to_team[name] = team
+
+    def team_of(self, name):
+        if not name:
+            return None
+        team = self.name_to_team.get(name)
+        if team is None and '#' in name:
+            # events sometimes drop the #tag that allPlayers includes, or vice versa
+            team = self.name_to_team.get(name.split('#')[0])
+        return team
+
+    def update(self, data):
+        """
+        Fold in the events from an allgamedata payload that haven't been seen.
+        Returns the list of newly processed events.
+        """
+        events = data.get('events', {}).get('Events', [])
+        game_time = data.get('gameData', {}).get('gameTime', 0) or 0
+
+        # new game (or client restarted): clock went backwards / list shrank
+        if game_time < self.last_game_time or len(events) < self.processed:
+            self.reset()
+        self.last_game_time = game_time
+
+        if not self.name_to_team:
+            self._learn_teams(data)
+
+        start = self.processed
+        # the list only ever grows, so the cursor is normally just an index;
+        # fall back to the EventID if it doesn't line up
+        if start and events[start - 1].get('EventID') != self.last_event_id:
+            start = next(
+                (i for i, e in enumerate(events) if e.get('EventID', -1) > self.last_event_id),
+                len(events)
+            )
+
+        new_events = events[start:]
+        for event in new_events:
+            self.apply(event, data)
+
+        self.processed = len(events)
+        if new_events:
+            self.last_event_id = new_events[-1].get('EventID', self.last_event_id)
+        return new_events
+
+    def apply(self, event, data=None):
+        name = event.get('EventName')
+
+        if name == 'ChampionKill':
+            team = self._team_with_refresh(event.get('KillerName'), data)
+            if team is None:
+                # executed by a turret/minion: credit the victim's enemies
+                victim_team = self._team_with_refresh(event.get('VictimName'), data)
+                team = _other(victim_team) if victim_team else None
+            if team in self.counts:
+                self.counts[team]['kills'] += 1
+
+        elif name == 'TurretKilled':
+            owner = _structure_owner(event.get('TurretKilled'))
+            if owner:
+                self.counts[_other(owner)]['towers'] += 1
+
+        elif name == 'InhibKilled':
+            owner = _structure_owner(event.get('InhibKilled'))
+            if owner:
+                self.counts[_other(owner)]['inhibs'] += 1
+
+        elif name in MONSTER_EVENTS:
+            team = self._team_with_refresh(event.get('KillerName'), data)
+            if team in self.counts:
+                self.counts[team][MONSTER_EVENTS[name]] += 1
+
+    def _team_with_refresh(self, name, data):
+        team = self.team_of(name)
+        if team is None and data is not None and name:
+            # a player we haven't mapped yet (e.g. roster filled in late)
+            self._learn_teams(data)
+            team = self.team_of(name)
+        return team
+
+
+def _base_name(name):
+    # events sometimes drop the #tag that allPlayers includes, or vice versa
+    return (name or '').split('#')[0]
+
+
+class KillIndex:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.deaths = {}            # victim base name -> sorted death times
+        self.seen = set()           # EventIDs already indexed
+        self.last_event_id = -1
+        self.last_game_time = 0
+
+    def update(self, data):
+        """Index the ChampionKills in an allgamedata payload that haven't been seen"""
+        events = data.get('events', {}).get('Events', [])
+        game_time = data.get('gameData', {}).get('gameTime', 0) or 0
+        if game_time < self.last_game_time:
+            self.reset()            # new game
+        self.last_game_time = game_time
+
+        # the list only grows, so walk back from the end to the last indexed id
+        new_events = []
+        for event in reversed(events):
+            event_id = event.get('EventID')
+            if event_id is not None and event_id <= self.last_event_id:
+                break
+            new_events.append(event)
+        for event in reversed(new_events):
+            self.add(event)
+            self.last_event_id = max(self.last_event_id, event.get('EventID', -1))
+
+    def add(self, event):
+        if event.get('EventName') != 'ChampionKill':
+            return
+        key = event.get('EventID')
+        if key is None:
+            key = (event.get('EventTime'), event.get('VictimName'))
+        if key in self.seen:
+            return
+        self.seen.add(key)
+        insort(self.deaths.setdefault(_base_name(event.get('VictimName')), []), event.get('EventTime', 0.0))
+
+    def died_between(self, name, start_t, end_t):
+        """True if name died at a time in [start_t, end_t]"""
+        times = self.deaths.get(_base_name(name))
+        if not times:
+            return False
+        i = bisect_left(times, start_t)
+        return i < len(times) and times[i] <= end_t
@@ -0,0 +1,267 @@
+#compressed, append-only recorder for raw allgamedata snapshots
+#
+#one .lrec log per game (+ a .idx keyframe index) under recordings/:
+#   - every KEYFRAME_EVERY records is a full snapshot, the rest are deltas
+#     against the previous snapshot (the events list only ever grows, so most
+#     deltas are a few changed scores plus an $append of new events)
+#   - records in a segment share one zlib stream (sync-flushed per record), so
+#     repeated keys/names compress across records; each keyframe restarts it
+#   - the .idx maps game time -> keyframe offset, so a reader can seek to any
+#     minute and only decode from the keyframe before it
+#
+#   recorder = LiveRecorder()
+#   recorder.record(poller.poll())
+#
+#   for game_time, wall_time, data in Recording(path).snapshots(start_time=600):
+#       ...
+#
+#   python live_recorder.py [recordings/ | game.lrec]   -> size/ratio summary
+
+import glob
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+
+# ---------- CONFIG ----------
+RECORD_DIR = 'recordings'
+KEYFRAME_EVERY = 60        # records per zlib segment (~1-2 min of polling)
+ZLIB_LEVEL = 6
+# ----------------------------
+
+MAGIC = b'LREC1\n'
+RECORD_HEADER = struct.Struct('<BddI')   # kind, game_time, wall_time, compressed length
+INDEX_ENTRY = struct.Struct('<dQI')      # game_time, file offset, record number
+KEYFRAME, DELTA = 0, 1
+
+
+def diff(old, new):
+    """
+    Delta that turns old into new, or None if they're equal.
+        {'$r': v}            replace with v
+        {'$d': {k: delta}, '$x': [k, ...]}   dict: changed / removed keys
+        {'$a': [...]}        list: items appended
+        {'$i': {i: delta}}   list: same length, some items changed
+    """
+    if type(old) is not type(new):
+        return {'$r': new}
+
+    if isinstance(new, dict):
+        changed = {}
+        for key, value in new.items():
+            if key not in old:
+                changed[key] = {'$r': value}
+            else:
+                d = diff(old[key], value)
+                if d is not None:
+                    changed[key] = d
+        removed = [key for key in old if key not in new]
+        if not changed and not removed:
+            return None
+        delta = {'$d': changed} if changed else {}
+        if removed:
+            delta['$x'] = removed
+        return delta
+
+    if isinstance(new, list):
+        n = len(old)
+        if len(new) >= n and new[:n] == old:
+            return {'$a': new[n:]} if len(new) > n else None
+        if len(new) == n:
+            items = {}
+            for i, (a, b) in enumerate(zip(old, new)):
+                d = diff(a, b)
+                if d is not None:
+                    items[str(i)] = d
+            return {'$i': items}
+        return {'$r': new}
+
+    return None if old == new else {'$r': new}
+
+
+def patch(old, delta):
+    """Apply a diff() delta; returns a new object and leaves old untouched"""
+    if delta is None:
+        return old
+    if '$r' in delta:
+        return delta['$r']
+    if '$a' in delta:
+        return old + delta['$a']
+    if '$i' in delta:
+        new = list(old)
+        for i, d in delta['$i'].items():
+            new[int(i)] = patch(new[int(i)], d)
+        return new
+
+    new = dict(old)
+    for key, d in delta.get('$d', {}).items():
+        new[key] = patch(old.get(key), d)
+    for key in delta.get('$x', ()):
+        new.pop(key, None)
+    return new
+
+
+class LiveRecorder:
+    def __init__(self, out_dir=RECORD_DIR, keyframe_every=KEYFRAME_EVERY, level=ZLIB_LEVEL):
+        self.out_dir = out_dir
+        self.keyframe_every = keyframe_every
+        self.level = level
+
+        self.path = None
+        self.log = None
+        self.index = None
+        self.compressor = None
+        self.previous = None
+        self.last_game_time = None
+        self.records = 0
+        self.written_bytes = 0
+
+    def record(self, data, wall_time=None):
+        """Append one allgamedata payload; loading screens / non-dicts are skipped"""
+        if not isinstance(data, dict):
+            return
+        game_time = data.get('gameData', {}).get('gameTime', 0) or 0
+        if game_time <= 0:
+            return
+        wall_time = time.time() if wall_time is None else wall_time
+
+        # clock went backwards -> a new game
+        if self.log is None or game_time < self.last_game_time - 1:
+            self._open(wall_time)
+        self.last_game_time = game_time
+
+        if self.records % self.keyframe_every == 0:
+            kind, body = KEYFRAME, data
+            self.compressor = zlib.compressobj(self.level)
+            self.index.write(INDEX_ENTRY.pack(game_time, self.log.tell(), self.records))
+        else:
+            kind, body = DELTA, diff(self.previous, data)
+
+        payload = json.dumps(body, separators=(',', ':')).encode()
+        chunk = self.compressor.compress(payload) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        self.log.write(RECORD_HEADER.pack(kind, game_time, wall_time, len(chunk)) + chunk)
+        # flush per record so a crash loses at most the snapshot being written
+        self.log.flush()
+        self.index.flush()
+
+        self.previous = data
+        self.records += 1
+        self.written_bytes += RECORD_HEADER.size + len(chunk)
+
+    def _open(self, wall_time):
+        self.close()
+        os.makedirs(self.out_dir, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(wall_time))
+        self.path = os.path.join(self.out_dir, f'game_{stamp}.lrec')
+        self.log = open(self.path, 'ab')
+        if self.log.tell() == 0:
+            self.log.write(MAGIC)
+        self.index = open(self.path[:-len('.lrec')] + '.idx', 'ab')
+        self.previous = None
+        self.records = 0
+        self.written_bytes = 0
+        print(f"💾 Recording live snapshots to {self.path}")
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+            self.index.close()
+            if self.records:
+                print(f"💾 {self.path}: {self.records} snapshots, {self.written_bytes / 1e6:.2f} MB")
+        self.log = None
+        self.index = None
+
+
+class Recording:
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path[:-len('.lrec')] + '.idx' if path.endswith('.lrec') else path + '.idx'
+
+    def records(self, offset=len(MAGIC)):
+        """(kind, game_time, wall_time, chunk) from offset; stops at a truncated tail"""
+        with open(self.path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a live recording")
+            f.seek(offset)
+            while True:
+                header = f.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+                kind, game_time, wall_time, length = RECORD_HEADER.unpack(header)
+                chunk = f.read(length)
+                if len(chunk) < length:
+                    return
+                yield kind, game_time, wall_time, chunk
+
+    def keyframes(self):
+        """[(game_time, offset)] from the .idx, rebuilt from the log if it's missing"""
+        if not os.path.exists(self.index_path):
+            return self.rebuild_index()
+        with open(self.index_path, 'rb') as f:
+            raw = f.read()
+        usable = len(raw) - len(raw) % INDEX_ENTRY.size
+        return [(t, offset) for t, offset, _ in INDEX_ENTRY.iter_unpack(raw[:usable])]
+
+    def rebuild_index(self):
+        """Scan record headers (no decompression) and rewrite the .idx"""
+        entries = []
+        offset = len(MAGIC)
+        for number, (kind, game_time, _, chunk) in enumerate(self.records()):
+            if kind == KEYFRAME:
+                entries.append(INDEX_ENTRY.pack(game_time, offset, number))
+            offset += RECORD_HEADER.size + len(chunk)
+        with open(self.index_path, 'wb') as f:
+            f.write(b''.join(entries))
+        return [(t, o) for t, o, _ in (INDEX_ENTRY.unpack(e) for e in entries)]
+
+    def snapshots(self, start_time=None):
+        """Yield (game_time, wall_time, data), optionally from start_time (seconds) on"""
+        offset = len(MAGIC)
+        if start_time is not None:
+            for game_time, keyframe_offset in self.keyframes():
+                if game_time > start_time:
+                    break
+                offset = keyframe_offset
+
+        current = None
+        decompressor = None
+        for kind, game_time, wall_time, chunk in self.records(offset):
+            if kind == KEYFRAME:
+                decompressor = zlib.decompressobj()
+            elif decompressor is None:
+                continue   # started mid-segment without a keyframe
+            body = json.loads(decompressor.decompress(chunk))
+            current = body if kind == KEYFRAME else patch(current, body)
+            if start_time is None or game_time >= start_time:
+                yield game_time, wall_time, current
+
+    def __iter__(self):
+        return self.snapshots()
+
+
+def list_recordings(path=RECORD_DIR):
+    """Every .lrec under a directory (oldest first), or [path] for a single file"""
+    if os.path.isfile(path):
+        return [path]
+    return sorted(glob.glob(os.path.join(path, '*.lrec')))
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else RECORD_DIR
+    paths = list_recordings(target)
+    if not paths:
+        print(f"✗ No recordings in {target}")
+        sys.exit(1)
+
+    print(f"{'recording':40s} {'snaps':>6s} {'minutes':>8s} {'MB':>7s} {'raw MB':>7s} {'ratio':>6s}")
+    for path in paths:
+        count, raw, last_time = 0, 0, 0.0
+        for game_time, _, data in Recording(path):
+            count += 1
+            raw += len(json.dumps(data, separators=(',', ':')))
+            last_time = game_time
+        size = os.path.getsize(path)
+        print(f"{os.path.basename(path):40s} {count:6d} {last_time / 60:8.1f} "
+              f"{size / 1e6:7.2f} {raw / 1e6:7.1f} {raw / max(1, size):5.0f}x")
@@ -0,0 +1,200 @@
+#headless mode: poll the Live Client once and broadcast predictions locally
+#
+#   python live_server.py [--port 8765]
+#
+#   GET  http://127.0.0.1:8765/state   latest snapshot as JSON
+#   GET  ws://127.0.0.1:8765/ws        pushes every new snapshot as a JSON text frame
+#
+#stream overlays, a second monitor, recorders etc. subscribe here instead of
+#each hitting port 2999 themselves. Snapshot shape:
+#   {"status", "game_time", "player_team", "blue", "red",
+#    "blue_win_prob", "player_win_prob", "death_risk", "timings_ms", "updated_at",
+#    "subscribers"}
+
+import argparse
+import base64
+import hashlib
+import json
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from live_client import LiveClientPoller
+from live_engine import DeathRiskStage, LiveEngine, WinProbabilityStage
+from live_recorder import RECORD_DIR, LiveRecorder
+from win_model import LiveScorer, load_live_model
+
+# ---------- CONFIG ----------
+HOST = '127.0.0.1'
+PORT = 8765
+WS_PING_SEC = 15           # idle websocket clients get a ping this often
+# ----------------------------
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class Broadcaster:
+    """Latest snapshot + a condition that wakes every waiting subscriber"""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.version = 0
+        self.payload = b'{}'
+        self.subscribers = 0        # open /ws connections, reported in every snapshot
+
+    def publish(self, snapshot):
+        with self.cond:
+            subscribers = self.subscribers
+        payload = json.dumps(dict(snapshot, subscribers=subscribers), separators=(',', ':')).encode()
+        with self.cond:
+            self.version += 1
+            self.payload = payload
+            self.cond.notify_all()
+
+    def latest(self):
+        with self.cond:
+            return self.version, self.payload
+
+    def wait_newer(self, version, timeout):
+        with self.cond:
+            self.cond.wait_for(lambda: self.version != version, timeout)
+            return self.version, self.payload
+
+    def subscribe(self):
+        with self.cond:
+            self.subscribers += 1
+
+    def unsubscribe(self):
+        with self.cond:
+            self.subscribers -= 1
+
+
+def ws_frame(payload, opcode=0x1):
+    """Unmasked server->client frame (FIN set)"""
+    header = bytes([0x80 | opcode])
+    n = len(payload)
+    if n < 126:
+        header += bytes([n])
+    elif n < 1 << 16:
+        header += bytes([126]) + struct.pack('!H', n)
+    else:
+        header += bytes([127]) + struct.pack('!Q', n)
+    return header + payload
+
+
+def make_handler(broadcaster):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def send_json(self, body, status=200):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == '/state':
+                self.send_json(broadcaster.latest()[1])
+            elif path == '/ws' and self.headers.get('Upgrade', '').lower() == 'websocket':
+                self.stream_websocket()
+            elif path == '/':
+                self.send_json(json.dumps({'endpoints': ['/state', '/ws']}).encode())
+            else:
+                self.send_json(b'{"error":"not found"}', status=404)
+
+        def stream_websocket(self):
+            key = self.headers.get('Sec-WebSocket-Key', '')
+            accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+            self.send_response(101)
+            self.send_header('Upgrade', 'websocket')
+            self.send_header('Connection', 'Upgrade')
+            self.send_header('Sec-WebSocket-Accept', accept)
+            self.end_headers()
+            self.wfile.flush()
+
+            broadcaster.subscribe()
+            try:
+                version, payload = broadcaster.latest()
+                self.wfile.write(ws_frame(payload))
+                while True:
+                    new_version, payload = broadcaster.wait_newer(version, WS_PING_SEC)
+                    if new_version == version:
+                        self.wfile.write(ws_frame(b'', opcode=0x9))  # ping; fails once the client is gone
+                    else:
+                        version = new_version
+                        self.wfile.write(ws_frame(payload))
+                    self.wfile.flush()
+            except OSError:
+                pass
+            finally:
+                broadcaster.unsubscribe()
+                self.close_connection = True
+
+    return Handler
+
+
+def snapshot_state(engine, snapshot):
+    """JSON-able state for subscribers"""
+    state = {'status': engine.poller.state, 'updated_at': time.time()}
+    if snapshot is not None:
+        state.update({
+            'game_time': snapshot.game_time,
+            'player_team': snapshot.player_team,
+            'blue': snapshot.blue,
+            'red': snapshot.red,
+            'blue_win_prob': snapshot.predictions.get('blue_win_prob'),
+            'player_win_prob': snapshot.player_win_prob,
+            'death_risk': snapshot.predictions.get('death_risk'),
+            'timings_ms': snapshot.timings_ms,
+        })
+    return state
+
+
+def build_engine(poller, recorder=None):
+    """Engine with every stage whose model loads"""
+    engine = LiveEngine(poller, recorder=recorder)
+    try:
+        engine.add_stage(WinProbabilityStage(LiveScorer(load_live_model())))
+    except Exception as e:
+        print(f"✗ Error loading model: {e}")
+    engine.add_stage(DeathRiskStage.load())
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Broadcast live predictions over HTTP + WebSocket")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--record', nargs='?', const=RECORD_DIR, metavar='DIR',
+                        help=f"also append every snapshot to a compressed log (default dir: {RECORD_DIR})")
+    args = parser.parse_args()
+
+    broadcaster = Broadcaster()
+    poller = LiveClientPoller(checkpoints_min=[10, 20, 30, 40])
+    recorder = LiveRecorder(args.record) if args.record else None
+    engine = build_engine(poller, recorder)
+    engine.subscribe(lambda snapshot: broadcaster.publish(snapshot_state(engine, snapshot)))
+    threading.Thread(target=engine.run, daemon=True).start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(broadcaster))
+    server.daemon_threads = True
+    print(f"📡 Serving http://{args.host}:{args.port}/state and ws://{args.host}:{args.port}/ws")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#team stats + model features from an allgamedata payload
+#
+#shared by the overlay and the headless consumers (live_server.py, ...), so
+#every one of them builds exactly the same feature vector
+
+from live_client import find_active_player
+
+
+def calculate_stats(data, tracker):
+    """
+    Calculate team stats from live game data.
+
+    tracker is a live_events.EventTracker; it folds in only the events that
+    are new since the previous call. Returns (blue_stats, red_stats, new_events).
+    """
+    blue_stats = {
+        'kills': 0, 'deaths': 0, 'assists': 0,
+        'gold': 0, 'cs': 0, 'level': 0, 'count': 0
+    }
+    red_stats = {
+        'kills': 0, 'deaths': 0, 'assists': 0,
+        'gold': 0, 'cs': 0, 'level': 0, 'count': 0
+    }
+
+    for player in data.get('allPlayers', []):
+        team = player.get('team', '')
+        scores = player.get('scores', {})
+
+        stats_dict = blue_stats if team == 'ORDER' else red_stats
+        stats_dict['kills'] += scores.get('kills', 0)
+        stats_dict['deaths'] += scores.get('deaths', 0)
+        stats_dict['assists'] += scores.get('assists', 0)
+        stats_dict['cs'] += scores.get('creepScore', 0)
+        stats_dict['level'] += player.get('level', 0)
+        stats_dict['count'] += 1
+
+        # Calculate total gold
+        current_gold = scores.get('currentGold', 0)
+        items_value = sum(item.get('price', 0) for item in player.get('items', []))
+        stats_dict['gold'] += current_gold + items_value
+
+    # Calculate averages
+    if blue_stats['count'] > 0:
+        blue_stats['avg_level'] = blue_stats['level'] / blue_stats['count']
+    if red_stats['count'] > 0:
+        red_stats['avg_level'] = red_stats['level'] / red_stats['count']
+
+    # Get objectives (only events newer than the last tick are processed)
+    new_events = tracker.update(data)
+    for key in ('towers', 'inhibs', 'dragons', 'heralds', 'barons'):
+        blue_stats[key] = tracker.counts['ORDER'][key]
+        red_stats[key] = tracker.counts['CHAOS'][key]
+
+    return blue_stats, red_stats, new_events
+
+
+def create_features(blue_stats, red_stats):
+    """Feature dict for the win model (blue minus red, same as data_collector.py)"""
+    return {
+        'kills_diff': blue_stats['kills'] - red_stats['kills'],
+        'deaths_diff': blue_stats['deaths'] - red_stats['deaths'],
+        'assists_diff': blue_stats['assists'] - red_stats['assists'],
+        'gold_diff': blue_stats['gold'] - red_stats['gold'],
+        'cs_diff': blue_stats['cs'] - red_stats['cs'],
+        'level_diff': blue_stats.get('avg_level', 0) - red_stats.get('avg_level', 0),
+        'towers_diff': blue_stats.get('towers', 0) - red_stats.get('towers', 0),
+        'inhibs_diff': blue_stats.get('inhibs', 0) - red_stats.get('inhibs', 0),
+        'dragons_diff': blue_stats.get('dragons', 0) - red_stats.get('dragons', 0),
+        'heralds_diff': blue_stats.get('heralds', 0) - red_stats.get('heralds', 0),
+        'barons_diff': blue_stats.get('barons', 0) - red_stats.get('barons', 0)
+    }
+
+
+def get_player_team(data, player=None):
+    """Determine which team the player is on (ORDER=Blue, CHAOS=Red)"""
+    # same name matching as the poller and the death-risk features
+    if player is None:
+        player = find_active_player(data)
+    return (player or {}).get('team') or 'ORDER'  # Default to blue if can't determine
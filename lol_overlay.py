@@ -1,14 +1,17 @@
-import requests
-import urllib3
 import time
+_STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk
 import threading
-import pickle
-import pandas as pd
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+
+from ui_scheduler import UIScheduler, UpdateQueue, flash
+
+# Heavy modules (openai, dotenv, requests, numpy, sqlite3) are imported by the
+# monitor/tips threads once the window is up, not here. Check the budget with
+#   python startup_report.py
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 '''
 Openai
 '''
@@ -25,36 +28,80 @@ Openai
 Open rounter
 '''
 import os 
-from dotenv import load_dotenv
 
-load_dotenv()
 # ---------- CONFIG ----------
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")  # Your OpenRouter key
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")  # Your OpenRouter key (.env is read by load_config)
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")  # openai_stub_server.py for local tests
+TIPS_MODEL = "anthropic/claude-3.5-haiku"
 CHECK_INTERVALS = [10, 20, 30, 40]
+TIPS_TIMEOUT_SEC = 8      # hard cap on how long a tip request may take
+TIPS_POLL_MS = 100        # how often the UI checks whether tips have arrived
+OVERLAY_ALPHA = 0.70
+PERF_REFRESH_MS = 500     # debug panel (F12) refresh while it's open
 # ----------------------------
 
-# Initialize OpenAI-compatible client pointing to OpenRouter
-client = OpenAI(
-    base_url="https://openrouter.ai/api/v1",
-    api_key=OPENROUTER_API_KEY
-) if OPENROUTER_API_KEY else None
+# OpenAI-compatible client pointing to OpenRouter, created on first use
+_client = None
+_client_lock = threading.Lock()
+
+# (name, seconds since interpreter start of this module) for --startup-report
+STARTUP_MARKS = []
+
+
+def mark_startup(name):
+    STARTUP_MARKS.append((name, time.perf_counter() - _STARTUP_T0))
+
+
+def load_config():
+    """Read .env (dotenv is imported here so it stays off the startup path)"""
+    global OPENROUTER_API_KEY, OPENROUTER_BASE_URL
+    from dotenv import load_dotenv
+    load_dotenv()
+    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+    OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", OPENROUTER_BASE_URL)
 
 
+def get_client():
+    """OpenRouter client, or None without a key; openai is imported on first call"""
+    global _client
+    if not OPENROUTER_API_KEY:
+        return None
+    with _client_lock:
+        if _client is None:
+            from openai import OpenAI
+            _client = OpenAI(
+                base_url=OPENROUTER_BASE_URL,
+                api_key=OPENROUTER_API_KEY
+            )
+    return _client
+
+
+def print_startup_report(path=None):
+    print("\n⏱ Startup timing (ms since lol_overlay import)")
+    for name, t in STARTUP_MARKS:
+        print(f"  {t * 1000:8.1f}  {name}")
+    if path:
+        import json
+        with open(path, 'w') as f:
+            json.dump({name: round(t * 1000, 2) for name, t in STARTUP_MARKS}, f, indent=2)
+
+
+mark_startup('imports')
 
 
 class StatsOverlay:
-    def __init__(self):
+    def __init__(self, poller=None, monitor=True, perf_log=None):
         self.root = tk.Tk()
         self.root.title("League ML Predictor")
         
         # Remove window border and make transparent
         self.root.overrideredirect(True)  # Remove border
         self.root.attributes('-topmost', True)
-        self.root.attributes('-alpha', 0.70)  # More visible
+        self.root.attributes('-alpha', OVERLAY_ALPHA)  # More visible
         
         # Smaller size, position in top-right corner
         screen_width = self.root.winfo_screenwidth()
-        self.root.geometry(f"320x400+{screen_width-340}+20")
+        self.root.geometry(f"320x460+{screen_width-340}+20")
         
         # Dark semi-transparent background
         self.root.configure(bg='#1a1a1a')
@@ -130,31 +177,107 @@ class StatsOverlay:
         # Stats frame
         self.stats_frame = tk.Frame(self.root, bg='#1a1a1a')
         self.stats_frame.pack(pady=5, padx=10, fill='both', expand=True)
+        self.build_stats_panel()
         
-        # Load ML model and scaler
-        try:
-            with open('league_win_predictor.pkl', 'rb') as f:
-                self.model = pickle.load(f)
-            with open('scaler.pkl', 'rb') as f:
-                self.scaler = pickle.load(f)
-            print("✓ ML Model loaded successfully")
-        except Exception as e:
-            print(f"✗ Error loading model: {e}")
-            self.model = None
-            self.scaler = None
+        # Engine (poller + models), tip cache and API client are set up by the
+        # monitor thread (see start_background) so the window appears first
+        self.engine = None
+        self.poller = poller  # None -> live client; replay.ReplayPoller to drive from a recording
+        self.tip_cache = None
+        self.tip_table = None        # offline tips (tip_table.json); shown instantly, LLM refines
+        self.tips_enabled = False
         
         # Tracking variables
         self.last_check_minute = 0
         self.monitoring = False
         self.is_minimized = False
         
+        # Flashes, fades and tip polling run as root.after state machines
+        self.scheduler = UIScheduler(self.root)
+        
+        # The monitor thread never touches Tk; it posts here and the Tk loop
+        # applies the newest update per widget once per frame
+        self.ui_queue = UpdateQueue()
+        self.ui_queue.attach(self.scheduler)
+        
+        # AI tips run off the Tk thread; only the newest request may touch the UI.
+        # Two workers: a superseded request still waiting on its first token
+        # never holds up the one that replaced it
+        self.tips_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tips')
+        self.tips_future = None
+        self.tips_generation = 0     # bumped per request; older streams stop posting
+        self.tips_partial = False    # some streamed text is already on screen
+        self.tips_timing = None      # {'ttft_ms', 'total_ms'} of the last streamed tip
+        self.tips_fallback = False   # a tip_table tip is on screen; keep it if the LLM fails
+        
+        # Checkpoint tips are fetched ahead of time from the projected state, on
+        # their own worker so a slow prefetch never delays a real request
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        self.prefetched = {}         # checkpoint minute -> (cache key, future)
+        
+        self.last_shown_prob = None
+        
+        # Per-stage latency (perf_stats.PerfStats, made in start_background);
+        # F12 shows it, --perf-log appends it to a JSON-lines file
+        self.perf = None
+        self.perf_log = perf_log
+        self.perf_window = None
+        self.root.bind_all('<F12>', self.toggle_perf_panel)
+        
         # For window dragging
         self.x = 0
         self.y = 0
         
-        # Start monitoring thread
+        mark_startup('window built')
+        
+        # Start monitoring thread (replay.py drives the panel itself instead)
         self.monitor_thread = threading.Thread(target=self.monitor_game, daemon=True)
-        self.monitor_thread.start()
+        if monitor:
+            self.monitor_thread.start()
+    
+    def start_background(self):
+        """Load config, model and live client off the Tk thread"""
+        load_config()
+        self.tips_enabled = bool(OPENROUTER_API_KEY)
+        if self.tips_enabled:
+            self.tips_executor.submit(get_client)  # warm the openai import before the first tip
+        mark_startup('config loaded')
+        
+        from live_client import FIGHT_EVENTS, LiveClientPoller
+        from live_engine import DeathRiskStage, LiveEngine, WinProbabilityStage
+        from perf_stats import PerfStats
+        from tip_cache import TipCache
+        from tip_table import TABLE_FILE, TipTable
+        from win_model import LiveScorer, load_live_model, resource_path
+        
+        # Keep-alive session; polls faster near checkpoints and during fights
+        if self.poller is None:
+            self.poller = LiveClientPoller(timeout=2, checkpoints_min=CHECK_INTERVALS)
+        self.fight_events = FIGHT_EVENTS  # kills/objectives that push a panel update right away
+        
+        # One poll + parse per tick feeds every model (replaces running
+        # risk_score/live_risk_score.py next to the overlay)
+        self.engine = LiveEngine(self.poller)
+        self.perf = PerfStats()
+        
+        # Load ML model and scaler (folded into one weight vector for live scoring)
+        try:
+            self.engine.add_stage(WinProbabilityStage(LiveScorer(load_live_model())))
+            print("✓ ML Model loaded successfully")
+        except Exception as e:
+            print(f"✗ Error loading model: {e}")
+        mark_startup('model loaded')
+        
+        # Optional: needs sklearn/joblib, which the lean build leaves out
+        self.engine.add_stage(DeathRiskStage.load())
+        
+        self.tip_cache = TipCache()
+        self.tip_table = TipTable.load(resource_path(TABLE_FILE))
+        
+        from timeline_chart import TimelineBuffer
+        from tip_prefetch import Trajectory
+        self.timeline = TimelineBuffer()
+        self.trajectory = Trajectory()
     
     def start_move(self, event):
         self.x = event.x
@@ -171,7 +294,7 @@ class StatsOverlay:
         if self.is_minimized:
             # Restore
             screen_width = self.root.winfo_screenwidth()
-            self.root.geometry(f"320x400+{screen_width-340}+20")
+            self.root.geometry(f"320x460+{screen_width-340}+20")
             self.stats_frame.pack(pady=5, padx=10, fill='both', expand=True)
             self.status_label.pack(pady=5)
             self.minimize_btn.config(text="_")
@@ -189,108 +312,95 @@ class StatsOverlay:
         if self.is_minimized:
             self.minimize_window()  # Toggle back to full size
         
-    def get_game_data(self):
-        try:
-            response = requests.get(
-                "https://127.0.0.1:2999/liveclientdata/allgamedata",
-                verify=False,
-                timeout=2
-            )
-            return response.json()
-        except:
-            return None
-    
-    def calculate_stats(self, data):
-        """Calculate team stats from live game data"""
-        blue_stats = {
-            'kills': 0, 'deaths': 0, 'assists': 0,
-            'gold': 0, 'cs': 0, 'level': 0, 'count': 0
-        }
-        red_stats = {
-            'kills': 0, 'deaths': 0, 'assists': 0,
-            'gold': 0, 'cs': 0, 'level': 0, 'count': 0
-        }
-        
-        for player in data.get('allPlayers', []):
-            team = player.get('team', '')
-            scores = player.get('scores', {})
-            
-            stats_dict = blue_stats if team == 'ORDER' else red_stats
-            stats_dict['kills'] += scores.get('kills', 0)
-            stats_dict['deaths'] += scores.get('deaths', 0)
-            stats_dict['assists'] += scores.get('assists', 0)
-            stats_dict['cs'] += scores.get('creepScore', 0)
-            stats_dict['level'] += player.get('level', 0)
-            stats_dict['count'] += 1
-            
-            # Calculate total gold
-            current_gold = scores.get('currentGold', 0)
-            items_value = sum(item.get('price', 0) for item in player.get('items', []))
-            stats_dict['gold'] += current_gold + items_value
-        
-        # Calculate averages
-        if blue_stats['count'] > 0:
-            blue_stats['avg_level'] = blue_stats['level'] / blue_stats['count']
-        if red_stats['count'] > 0:
-            red_stats['avg_level'] = red_stats['level'] / red_stats['count']
-        
-        # Get objectives (simplified for live API)
-        events = data.get('events', {}).get('Events', [])
-        blue_stats['towers'] = sum(1 for e in events if e.get('EventName') == 'TurretKilled' and 'ORDER' in str(e.get('KillerName', '')))
-        red_stats['towers'] = sum(1 for e in events if e.get('EventName') == 'TurretKilled' and 'CHAOS' in str(e.get('KillerName', '')))
-        blue_stats['dragons'] = sum(1 for e in events if e.get('EventName') == 'DragonKill' and 'ORDER' in str(e.get('Stolen', '')))
-        red_stats['dragons'] = sum(1 for e in events if e.get('EventName') == 'DragonKill' and 'CHAOS' in str(e.get('Stolen', '')))
-        
-        return blue_stats, red_stats
-    
-    def create_feature_vector(self, blue_stats, red_stats):
-        """Create feature vector for ML model"""
-        features = {
-            'kills_diff': blue_stats['kills'] - red_stats['kills'],
-            'deaths_diff': blue_stats['deaths'] - red_stats['deaths'],
-            'assists_diff': blue_stats['assists'] - red_stats['assists'],
-            'gold_diff': blue_stats['gold'] - red_stats['gold'],
-            'cs_diff': blue_stats['cs'] - red_stats['cs'],
-            'level_diff': blue_stats.get('avg_level', 0) - red_stats.get('avg_level', 0),
-            'towers_diff': blue_stats.get('towers', 0) - red_stats.get('towers', 0),
-            'inhibs_diff': 0,  # Live API doesn't track this easily
-            'dragons_diff': blue_stats.get('dragons', 0) - red_stats.get('dragons', 0),
-            'heralds_diff': 0,  # Live API doesn't track this easily
-            'barons_diff': 0   # Live API doesn't track this easily
-        }
-        return pd.DataFrame([features])
-    
-    def get_player_team(self, data):
-        """Determine which team the player is on"""
-        # Try to identify player's team from active player data
-        try:
-            active_player = data.get('activePlayer', {})
-            summoner_name = active_player.get('summonerName', '')
-            
-            # Find player in allPlayers
-            for player in data.get('allPlayers', []):
-                if player.get('summonerName') == summoner_name:
-                    return player.get('team', 'ORDER')  # ORDER=Blue, CHAOS=Red
-        except:
-            pass
-        return 'ORDER'  # Default to blue if can't determine
-    
-    def get_openai_tips(self, blue_prob, red_prob, blue_stats, red_stats, game_time_min, player_team):
-        """Get AI-generated tips for the PLAYER'S team"""
+    def get_openai_tips(self, blue_prob, red_prob, blue_stats, red_stats, game_time_min, player_team,
+                        generation=None, deadline=None):
+        """
+        Get AI-generated tips for the PLAYER'S team. The completion is streamed:
+        partial text is posted to the panel as tokens arrive, and the stream is
+        abandoned as soon as a newer request supersedes this one (generation).
+        deadline (time.monotonic()) is when the UI gives up on this request.
+        """
+        from tip_cache import quantize_state
+        
+        client = get_client()
         if not client:
             return "⚠️ OpenRouter API key not configured"
         
         # Determine if player is winning or losing
         is_blue_team = (player_team == 'ORDER')
         player_prob = blue_prob if is_blue_team else red_prob
-        opponent_prob = red_prob if is_blue_team else blue_prob
         player_stats = blue_stats if is_blue_team else red_stats
         opponent_stats = red_stats if is_blue_team else blue_stats
         team_name = "Blue" if is_blue_team else "Red"
         
-        is_winning = player_prob > opponent_prob
+        # Same rough game state as a previous checkpoint (or as the prefetch
+        # projected for this one) -> reuse its tips
+        cache_key = quantize_state(player_prob, player_stats, opponent_stats, game_time_min)
+        if deadline is None:
+            deadline = time.monotonic() + TIPS_TIMEOUT_SEC
+        prefetch_key, prefetch_future = self.prefetched.get(game_time_min, (None, None))
+        if prefetch_key == cache_key:
+            try:
+                # still in flight: cheaper than a second call, but only while the UI is still waiting
+                prefetch_future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                pass
+        elif prefetch_key is not None:
+            print(f"⚡ Prefetch missed: projected {prefetch_key}, got {cache_key}")
+        cached_tips = self.tip_cache.get(cache_key)
+        if cached_tips is not None:
+            if prefetch_key == cache_key:
+                print(f"⚡ Prefetched {game_time_min}-minute tip reused")
+            return cached_tips
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or (generation is not None and generation != self.tips_generation):
+            return None  # the UI already gave up on (or replaced) this request
+        
+        prompt = self.tip_prompt(player_prob, player_stats, opponent_stats, game_time_min, team_name)
         
-        if is_winning:
+        try:
+            started = time.perf_counter()
+            first_token = None
+            parts = []
+            stream = client.chat.completions.create(
+                model=TIPS_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=100,
+                temperature=0.7,
+                timeout=remaining,
+                stream=True
+            )
+            try:
+                for chunk in stream:
+                    if generation is not None and generation != self.tips_generation:
+                        return None  # superseded; stop paying for tokens nobody will see
+                    token = chunk.choices[0].delta.content if chunk.choices else None
+                    if not token:
+                        continue
+                    if first_token is None:
+                        first_token = time.perf_counter() - started
+                    parts.append(token)
+                    self.tips_partial = True
+                    self.ui_queue.post('tips', lambda text=''.join(parts).lstrip(), g=generation: self.show_partial_tips(text, g))
+            finally:
+                stream.close()  # frees the connection whether we finished, bailed or failed
+            
+            total = time.perf_counter() - started
+            self.tips_timing = {'ttft_ms': (first_token or total) * 1000, 'total_ms': total * 1000}
+            print(f"⏱ Tips: first token {self.tips_timing['ttft_ms']:.0f}ms, done {self.tips_timing['total_ms']:.0f}ms")
+            self.perf.add('tips_ttft', self.tips_timing['ttft_ms'])
+            self.perf.add('tips_total', self.tips_timing['total_ms'])
+            
+            tips = ''.join(parts).strip()
+            self.tip_cache.put(cache_key, tips)
+            return tips
+        except Exception as e:
+            return f"⚠️ AI tips unavailable: {str(e)[:50]}"
+    
+    def tip_prompt(self, player_prob, player_stats, opponent_stats, game_time_min, team_name):
+        """Prompt for the player's team at a checkpoint (also used for prefetches)"""
+        if player_prob > 0.5:
             prompt = f"""You are a League of Legends analyst. At {game_time_min} minutes, YOU are on {team_name} team and WINNING with {player_prob:.0%} win probability.
 
 Your stats vs Enemy:
@@ -308,62 +418,84 @@ Your stats vs Enemy:
 - Towers: {player_stats.get('towers', 0)} vs {opponent_stats.get('towers', 0)}
 
 Give 3 SHORT, actionable tips (10 words each max) for YOUR team to COMEBACK. Be specific and strategic."""
-
+        return prompt
+    
+    def prefetch_tips(self, cache_key, player_prob, player_stats, opponent_stats, game_time_min, team_name):
+        """Fetch a tip for a projected checkpoint state into the cache (no UI)"""
+        client = get_client()
+        if not client or self.tip_cache.get(cache_key) is not None:
+            return
+        prompt = self.tip_prompt(player_prob, player_stats, opponent_stats, game_time_min, team_name)
         try:
             response = client.chat.completions.create(
-                model="anthropic/claude-3.5-haiku",
+                model=TIPS_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=100,
-                temperature=0.7
+                temperature=0.7,
+                timeout=TIPS_TIMEOUT_SEC
             )
-            return response.choices[0].message.content.strip()
+            self.tip_cache.put(cache_key, response.choices[0].message.content.strip())
         except Exception as e:
-            return f"⚠️ AI tips unavailable: {str(e)[:50]}"
+            print(f"⚠ Tip prefetch failed: {str(e)[:50]}")
     
-    def display_stats(self, blue_stats, red_stats, game_time, blue_prob, red_prob, player_team):
-        """Display stats with ML prediction"""
-        # Clear previous stats
-        for widget in self.stats_frame.winfo_children():
-            widget.destroy()
-        
-        minutes = int(game_time // 60)
+    def maybe_prefetch_tips(self, game_time, player_team):
+        """Start a prefetch when the next checkpoint is PREFETCH_LEAD_SEC away"""
+        from tip_cache import quantize_state
+        from tip_prefetch import due_checkpoint
+        
+        minute = due_checkpoint(game_time, CHECK_INTERVALS, self.prefetched)
+        if minute is None:
+            return
+        projection = self.trajectory.project(minute * 60)
+        if projection is None:
+            return  # not enough history yet; the next tick retries
+        player_prob, player_stats, opponent_stats = projection
+        cache_key = quantize_state(player_prob, player_stats, opponent_stats, minute)
+        team_name = "Blue" if player_team == 'ORDER' else "Red"
+        future = self.prefetch_executor.submit(self.prefetch_tips, cache_key, player_prob,
+                                               player_stats, opponent_stats, minute, team_name)
+        self.prefetched[minute] = (cache_key, future)
+        print(f"⚡ Prefetching {minute}-minute tip for projected state {cache_key}")
+    
+    def build_stats_panel(self):
+        """Create the prediction panel once; display_stats only updates it"""
+        self.time_var = tk.StringVar()
+        self.result_var = tk.StringVar()
+        self.prob_var = tk.StringVar()
+        self.enemy_prob_var = tk.StringVar()
+        self.risk_var = tk.StringVar()
+        self.tip_header_var = tk.StringVar()
         
-        # Determine if player is winning
-        is_blue_team = (player_team == 'ORDER')
-        player_prob = blue_prob if is_blue_team else red_prob
-        is_winning = player_prob > (1 - player_prob)
+        self.panel_widgets = []
         
         # Time header
         time_label = tk.Label(
             self.stats_frame,
-            text=f"Analysis at {minutes} Minutes",
+            textvariable=self.time_var,
             font=("Segoe UI", 11, "bold"),
             bg='#1a1a1a',
             fg='#ffffff'
         )
-        time_label.pack(pady=8)
+        self.panel_widgets.append((time_label, dict(pady=8)))
         
         # Status
-        status_text = "YOU ARE WINNING" if is_winning else "YOU ARE LOSING"
-        status_color = '#00ff88' if is_winning else '#ff6666'
-        
-        tk.Label(
+        self.result_label = tk.Label(
             self.stats_frame,
-            text=status_text,
+            textvariable=self.result_var,
             font=("Segoe UI", 9, "bold"),
             bg='#1a1a1a',
-            fg=status_color
-        ).pack(pady=3)
+            fg='#00ff88'
+        )
+        self.panel_widgets.append((self.result_label, dict(pady=3)))
         
         # Probability display
         prob_frame = tk.Frame(self.stats_frame, bg='#2a2a2a', relief='flat')
-        prob_frame.pack(fill='x', pady=8, padx=10)
+        self.panel_widgets.append((prob_frame, dict(fill='x', pady=8, padx=10)))
         
         # Your probability (larger)
-        your_prob = blue_prob if is_blue_team else red_prob
         tk.Label(
             prob_frame,
-            text=f"{your_prob:.0%}",
+            textvariable=self.prob_var,
             font=("Segoe UI", 28, "bold"),
             bg='#2a2a2a',
             fg='#ffffff'
@@ -378,116 +510,366 @@ Give 3 SHORT, actionable tips (10 words each max) for YOUR team to COMEBACK. Be
         ).pack()
         
         # Opponent probability (smaller)
-        opp_prob = red_prob if is_blue_team else blue_prob
         tk.Label(
             prob_frame,
-            text=f"Enemy: {opp_prob:.0%}",
+            textvariable=self.enemy_prob_var,
             font=("Segoe UI", 9),
             bg='#2a2a2a',
             fg='#666666'
         ).pack(pady=(5,5))
         
+        # Death risk (packed on the first value; needs the death-risk model)
+        self.risk_label = tk.Label(
+            prob_frame,
+            textvariable=self.risk_var,
+            font=("Segoe UI", 9),
+            bg='#2a2a2a',
+            fg='#999999'
+        )
+        
+        # Win probability / gold diff history (your team's perspective); the
+        # chart itself is built on first draw so numpy stays off the startup path
+        self.chart_frame = tk.Frame(self.stats_frame, bg='#1a1a1a')
+        self.panel_widgets.append((self.chart_frame, dict(pady=(0,5), padx=10)))
+        self.chart = None
+        
+        # AI Tips (only packed if an API key turns up in load_config)
+        self.tips_frame = tk.Frame(self.stats_frame, bg='#2a2a2a', relief='flat')
+        self.panel_widgets.append((self.tips_frame, dict(fill='both', expand=True, pady=5, padx=10)))
+        
+        tk.Label(
+            self.tips_frame,
+            textvariable=self.tip_header_var,
+            font=("Segoe UI", 9, "bold"),
+            bg='#2a2a2a',
+            fg='#ffffff'
+        ).pack(anchor='w', padx=8, pady=(8,3))
+        
+        self.tips_text = tk.Text(
+            self.tips_frame,
+            font=("Segoe UI", 8),
+            bg='#1a1a1a',
+            fg='#cccccc',
+            height=4,
+            wrap='word',
+            relief='flat',
+            padx=8,
+            pady=5,
+            borderwidth=0,
+            state='disabled'
+        )
+        self.tips_text.pack(fill='both', expand=True, pady=(0,8), padx=8)
+        
+        # Shown on the first prediction, so "Waiting for game..." stays alone until then
+        self.panel_shown = False
+        self.analysis_minute = None  # last checkpoint shown in the header
+    
+    def display_stats(self, blue_stats, red_stats, game_time, blue_prob, red_prob, player_team, checkpoint=True):
+        """Display stats with ML prediction; tips are only requested at checkpoints"""
+        started = time.perf_counter()
+        if not self.panel_shown:
+            for widget, pack_opts in self.panel_widgets:
+                if widget is self.tips_frame and not (self.tips_enabled or self.tip_table):
+                    continue
+                widget.pack(**pack_opts)
+            self.panel_shown = True
+        
+        minutes = int(game_time // 60)
+        
+        # Determine if player is winning
+        is_blue_team = (player_team == 'ORDER')
+        player_prob = blue_prob if is_blue_team else red_prob
+        is_winning = player_prob > (1 - player_prob)
+        
+        # The header moves with the probability; the checkpoint the tips
+        # belong to stays named until the next one
+        if checkpoint:
+            self.analysis_minute = minutes
+        elif self.analysis_minute is not None and minutes < self.analysis_minute:
+            self.analysis_minute = None  # new game
+        clock = f"{minutes}:{int(game_time % 60):02d}"
+        if checkpoint:
+            self.time_var.set(f"Analysis at {minutes} Minutes")
+        elif self.analysis_minute is not None:
+            self.time_var.set(f"Live {clock} · last analysis {self.analysis_minute} min")
+        else:
+            self.time_var.set(f"Live Prediction {clock}")
+        
+        self.result_var.set("YOU ARE WINNING" if is_winning else "YOU ARE LOSING")
+        self.result_label.config(fg='#00ff88' if is_winning else '#ff6666')
+        
+        your_prob = blue_prob if is_blue_team else red_prob
+        opp_prob = red_prob if is_blue_team else blue_prob
+        self.prob_var.set(f"{your_prob:.0%}")
+        self.enemy_prob_var.set(f"Enemy: {opp_prob:.0%}")
+        
         # AI Tips
-        if client:
-            tips_frame = tk.Frame(self.stats_frame, bg='#2a2a2a', relief='flat')
-            tips_frame.pack(fill='both', expand=True, pady=5, padx=10)
+        if checkpoint and (self.tips_enabled or self.tip_table):
+            self.tip_header_var.set("Strategy: Close Out" if is_winning else "Strategy: Comeback")
             
-            tip_header = "Strategy: Close Out" if is_winning else "Strategy: Comeback"
-            tk.Label(
-                tips_frame,
-                text=tip_header,
-                font=("Segoe UI", 9, "bold"),
-                bg='#2a2a2a',
-                fg='#ffffff'
-            ).pack(anchor='w', padx=8, pady=(8,3))
-            
-            tips = self.get_openai_tips(blue_prob, red_prob, blue_stats, red_stats, minutes, player_team)
+            # Precomputed tip right away (no network); the live one streams over it
+            self.tips_fallback = self.tip_table is not None
+            if self.tips_fallback:
+                player_stats = blue_stats if is_blue_team else red_stats
+                opponent_stats = red_stats if is_blue_team else blue_stats
+                self.set_tips_text(self.tip_table.lookup(player_prob, player_stats, opponent_stats, minutes))
+            else:
+                self.set_tips_text("Generating tips...")
             
-            tips_text = tk.Text(
-                tips_frame,
-                font=("Segoe UI", 8),
+            # Probability panel is already drawn; tips fill in when they arrive
+            if self.tips_enabled:
+                self.request_tips(blue_prob, red_prob, blue_stats, red_stats, minutes, player_team)
+        
+        self.record_render('render_stats', started)
+    
+    def draw_chart(self):
+        started = time.perf_counter()
+        if self.chart is None:
+            from timeline_chart import TimelineChart
+            self.chart = TimelineChart(self.chart_frame, self.timeline, width=280, height=56)
+            self.chart.canvas.pack()
+        self.chart.draw()
+        self.record_render('render_chart', started)
+    
+    def record_render(self, stage, started):
+        # Tk-side work only; the actual repaint happens when the loop goes idle
+        if self.perf is not None:
+            self.perf.add(stage, (time.perf_counter() - started) * 1000)
+    
+    def toggle_perf_panel(self, event=None):
+        """F12: small always-on-top window with per-stage p50/p99"""
+        if self.perf_window is None:
+            self.perf_window = tk.Toplevel(self.root)
+            self.perf_window.title("Overlay timings")
+            self.perf_window.attributes('-topmost', True)
+            self.perf_window.configure(bg='#1a1a1a')
+            self.perf_window.protocol('WM_DELETE_WINDOW', self.toggle_perf_panel)
+            self.perf_var = tk.StringVar(value="Waiting for the first poll...")
+            tk.Label(
+                self.perf_window,
+                textvariable=self.perf_var,
+                font=("Consolas", 9),
                 bg='#1a1a1a',
                 fg='#cccccc',
-                height=4,
-                wrap='word',
-                relief='flat',
-                padx=8,
-                pady=5,
-                borderwidth=0
-            )
-            tips_text.pack(fill='both', expand=True, pady=(0,8), padx=8)
-            tips_text.insert('1.0', tips)
-            tips_text.config(state='disabled')
+                justify='left'
+            ).pack(padx=8, pady=6)
+        elif self.perf_window.state() != 'withdrawn':
+            self.perf_window.withdraw()
+            self.scheduler.cancel('perf')
+            return
+        
+        self.perf_window.deiconify()
+        self.scheduler.every('perf', PERF_REFRESH_MS, self.refresh_perf_panel)
+    
+    def refresh_perf_panel(self):
+        if self.perf is not None:
+            from perf_stats import format_table
+            self.perf_var.set(format_table(self.perf.summary()))
+    
+    def show_death_risk(self, risk):
+        if not self.panel_shown:
+            return
+        if not self.risk_label.winfo_ismapped():
+            self.risk_label.pack(pady=(0,5))
+        self.risk_var.set(f"Death risk (10s): {risk:.0%}")
+        self.risk_label.config(fg='#ff6666' if risk >= 0.5 else '#ffcc66' if risk >= 0.25 else '#999999')
+    
+    def set_tips_text(self, tips):
+        self.tips_text.config(state='normal')
+        self.tips_text.delete('1.0', 'end')
+        self.tips_text.insert('1.0', tips)
+        self.tips_text.config(state='disabled')
+    
+    def request_tips(self, *tip_args):
+        """Start a background tip request, superseding any one still running"""
+        if self.tips_future is not None:
+            self.tips_future.cancel()  # if it already started, its stream stops and closes at the next chunk
+        
+        self.tips_generation += 1
+        self.tips_partial = False
+        deadline = time.monotonic() + TIPS_TIMEOUT_SEC
+        self.tips_future = self.tips_executor.submit(self.get_openai_tips, *tip_args,
+                                                     generation=self.tips_generation, deadline=deadline)
+        # Restarting the 'tips' task drops the wait for the superseded request
+        self.scheduler.start('tips', self.wait_for_tips(self.tips_future, deadline))
+    
+    def show_partial_tips(self, text, generation):
+        # a stale stream's last post can still be queued when a new request starts
+        if generation == self.tips_generation:
+            self.set_tips_text(text)
+    
+    def wait_for_tips(self, future, deadline):
+        while not future.done():
+            if time.monotonic() >= deadline:
+                future.cancel()
+                self.tips_generation += 1  # ends the stream; whatever arrived stays on screen
+                if not (self.tips_partial or self.tips_fallback):
+                    self.set_tips_text("⚠️ AI tips timed out")
+                return
+            yield TIPS_POLL_MS
+        
+        if future.cancelled():
+            return
+        try:
+            tips = future.result()
+        except Exception as e:
+            tips = f"⚠️ AI tips unavailable: {str(e)[:50]}"
+        if tips is None or (tips.startswith("⚠️") and self.tips_fallback and not self.tips_partial):
+            return  # superseded, or failed with the precomputed tip still showing
+        self.set_tips_text(tips)
+    
+    def should_refresh(self, blue_prob):
+        # Skip panel updates that wouldn't change the displayed percentage
+        return self.last_shown_prob is None or round(blue_prob, 2) != round(self.last_shown_prob, 2)
     
     def monitor_game(self):
+        self.start_background()
+        from perf_stats import PERF_DUMP_SEC
+        
+        first_poll = True
+        next_dump = time.monotonic() + PERF_DUMP_SEC
         while True:
-            data = self.get_game_data()
+            snapshot = self.engine.tick()
+            if first_poll:
+                mark_startup('first poll')
+                first_poll = False
             
-            if data is None:
-                self.root.after(0, lambda: self.status_label.config(
+            if self.perf_log and time.monotonic() >= next_dump:
+                next_dump = time.monotonic() + PERF_DUMP_SEC
+                self.dump_perf(game_time=snapshot.game_time if snapshot is not None else None)
+            
+            if snapshot is None:
+                self.ui_queue.post('status', lambda: self.status_label.config(
                     text="Waiting for game...",
                     fg='#999999'
                 ))
                 self.monitoring = False
                 self.last_check_minute = 0
-                time.sleep(5)
+                self.last_shown_prob = None
+                self.poller.sleep()  # backs off while the client is absent
                 continue
             
+            self.perf.add_all(snapshot.timings_ms)
+            
             # Get game time
-            game_time = data.get('gameData', {}).get('gameTime', 0)
+            game_time = snapshot.game_time
             current_minute = int(game_time // 60)
             
             if not self.monitoring:
                 self.monitoring = True
+                self.timeline.reset()  # new game (or client came back): start a fresh chart
+                self.trajectory.reset()
+                self.prefetched = {}
+            
+            self.ui_queue.post('status', lambda m=current_minute, s=int(game_time % 60): 
+                               self.status_label.config(
+                                   text=f"Game in progress - {m}:{s:02d}",
+                                   fg='#00ff88'
+                               ))
+            
+            blue_stats, red_stats = snapshot.blue, snapshot.red
+            player_team = snapshot.player_team
+            
+            # Every poll is scored; the poller already polls faster right after
+            # a kill/objective, and those ticks are pushed straight to the panel
+            blue_prob = snapshot.predictions.get('blue_win_prob')
+            if blue_prob is None:
+                blue_prob = 0.5
+            red_prob = 1.0 - blue_prob
+            objective_landed = any(e.get('EventName') in self.fight_events for e in snapshot.new_events)
+            
+            # History goes in from this thread; the Tk side only draws new columns
+            is_blue_team = player_team == 'ORDER'
+            gold_diff = blue_stats['gold'] - red_stats['gold']
+            self.timeline.append(game_time, (blue_prob if is_blue_team else red_prob,
+                                             gold_diff if is_blue_team else -gold_diff))
+            self.ui_queue.post('chart', self.draw_chart)
             
-            self.root.after(0, lambda m=current_minute, s=int(game_time % 60): 
-                           self.status_label.config(
-                               text=f"Game in progress - {m}:{s:02d}",
-                               fg='#00ff88'
-                           ))
+            self.trajectory.add(game_time, blue_prob if is_blue_team else red_prob,
+                                blue_stats if is_blue_team else red_stats,
+                                red_stats if is_blue_team else blue_stats)
+            if self.tips_enabled:
+                self.maybe_prefetch_tips(game_time, player_team)
+            
+            death_risk = snapshot.predictions.get('death_risk')
+            if death_risk is not None:
+                self.ui_queue.post('risk', lambda r=death_risk: self.show_death_risk(r))
             
             # Check if we hit an interval
-            if current_minute in CHECK_INTERVALS and current_minute != self.last_check_minute:
+            is_checkpoint = current_minute in CHECK_INTERVALS and current_minute != self.last_check_minute
+            if is_checkpoint:
                 self.last_check_minute = current_minute
-                
-                blue_stats, red_stats = self.calculate_stats(data)
-                
-                # Determine player's team
-                player_team = self.get_player_team(data)
-                
-                # Make ML prediction
-                if self.model and self.scaler:
-                    features = self.create_feature_vector(blue_stats, red_stats)
-                    features_scaled = self.scaler.transform(features)
-                    probabilities = self.model.predict_proba(features_scaled)[0]
-                    red_prob, blue_prob = probabilities[0], probabilities[1]
-                else:
-                    blue_prob, red_prob = 0.5, 0.5
-                
-                self.root.after(0, lambda b=blue_stats, r=red_stats, t=game_time, bp=blue_prob, rp=red_prob, pt=player_team: 
-                               self.display_stats(b, r, t, bp, rp, pt))
-                
+            
+            if is_checkpoint or objective_landed or self.should_refresh(blue_prob):
+                self.last_shown_prob = blue_prob
+                self.ui_queue.post('checkpoint' if is_checkpoint else 'live',
+                                   lambda b=blue_stats, r=red_stats, t=game_time, bp=blue_prob, rp=red_prob, pt=player_team, c=is_checkpoint: 
+                                   self.display_stats(b, r, t, bp, rp, pt, checkpoint=c))
+            
+            if is_checkpoint:
                 # Flash window
-                self.root.after(0, self.flash_window)
+                self.ui_queue.post('flash', self.flash_window)
             
-            time.sleep(2)
+            self.poller.sleep()
+    
+    def dump_perf(self, **extra):
+        try:
+            self.perf.dump(self.perf_log, **extra)
+        except OSError as e:
+            print(f"⚠ Could not write {self.perf_log}: {e}")
+            self.perf_log = None
     
     def flash_window(self):
         # Restore if minimized
         self.restore_window()
         
-        # Flash effect
-        for _ in range(3):
-            self.root.attributes('-alpha', 1.0)
-            self.root.update()
-            time.sleep(0.2)
-            self.root.attributes('-alpha', 0.70)
-            self.root.update()
-            time.sleep(0.2)
+        # Flash effect (non-blocking, stepped by the scheduler)
+        self.scheduler.start('flash', flash(self.root, rest_alpha=OVERLAY_ALPHA))
+    
+    def on_first_frame(self, report_path, exit_after):
+        mark_startup('first frame')
+        if exit_after:
+            self.root.quit()
     
-    def run(self):
+    def run(self, report=False, report_path=None, exit_after_first_frame=False):
+        # after_idle fires once Tk has drawn the initial window
+        self.root.after_idle(self.on_first_frame, report_path, exit_after_first_frame)
         self.root.mainloop()
+        self.scheduler.cancel_all()
+        if self.poller is not None:
+            self.poller.stop()
+        self.tips_executor.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        if self.perf_log and self.perf is not None:
+            self.dump_perf(final=True)
+        if self.tip_cache is not None:
+            self.tip_cache.close()
+        if report:
+            print_startup_report(report_path)
 
 if __name__ == "__main__":
-    app = StatsOverlay()
-    app.run()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="League ML Predictor overlay")
+    parser.add_argument('--startup-report', nargs='?', const='', metavar='JSON',
+                        help="print startup timings on exit (and write them to JSON)")
+    parser.add_argument('--exit-after-first-frame', action='store_true',
+                        help="quit as soon as the window is drawn (launch-time measurement)")
+    parser.add_argument('--replay', metavar='LREC',
+                        help="drive the overlay from a recorded game instead of the live client")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="replay speed (1 = real time, 0 = unthrottled)")
+    parser.add_argument('--perf-log', metavar='JSONL',
+                        help="append per-stage p50/p99 timings to this file every 30s (summarize with perf_stats.py)")
+    args = parser.parse_args()
+    
+    replay_poller = None
+    if args.replay:
+        from replay import ReplayPoller
+        replay_poller = ReplayPoller(args.replay, speed=args.speed, checkpoints_min=CHECK_INTERVALS)
+    
+    app = StatsOverlay(poller=replay_poller, perf_log=args.perf_log)
+    app.run(
+        report=args.startup_report is not None or args.exit_after_first_frame,
+        report_path=args.startup_report or None,
+        exit_after_first_frame=args.exit_after_first_frame
+    )
\ No newline at end of file
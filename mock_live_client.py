@@ -0,0 +1,407 @@
+#local stand-in for the League Live Client Data API
+#
+#serves /liveclientdata/{allgamedata,activeplayer,activeplayername,playerlist,
+#eventdata,gamestats} from a synthetic game or a recording (live_recorder.py),
+#with the game clock running at --speed. Latency, jitter, payload padding and
+#error injection make it usable for polling/parsing benchmarks without the game.
+#
+#   python mock_live_client.py --port 2999 --speed 10 --latency-ms 5 --jitter-ms 3
+#   python mock_live_client.py --recording recordings/game_....lrec --error-rate 0.05
+#   LIVE_CLIENT_URL=http://127.0.0.1:2999 python lol_overlay.py
+#   python mock_live_client.py --seats 5   # ports 2999-3003: one game, Blue1..Blue5 each on their own port
+#
+#the real client is https with a self-signed cert; pass --cert/--key to serve
+#TLS too (e.g. openssl req -x509 -newkey rsa:2048 -nodes -subj /CN=127.0.0.1 ...)
+#
+#GET /mock/stats returns request/outcome counters
+
+import argparse
+import copy
+import json
+import random
+import ssl
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# ---------- CONFIG ----------
+PORT = 2999
+GAME_MINUTES = 35
+LOADING_SEC = 0            # 404 (like the loading screen) for this long after start
+# ----------------------------
+
+TEAM_SIZE = 5
+ITEM_PRICE = 1100
+DRAGON_START, DRAGON_RESPAWN = 300, 300
+HERALD_START, BARON_START, BARON_RESPAWN = 480, 1200, 360
+TURRETS = [f'{lane}_{tier}' for tier in ('03_A', '02_A', '01_A') for lane in ('L', 'C', 'R')]
+INHIBS = ['L1', 'C1', 'R1']
+
+
+class SyntheticGame:
+    """
+    Deterministic fake game advanced one second at a time: farm, fights,
+    structures and objectives, biased towards whichever team rolled stronger.
+    """
+
+    def __init__(self, seed=0, minutes=GAME_MINUTES):
+        self.seed = seed
+        self.minutes = minutes
+        self.rng = random.Random(seed)
+        self.duration = minutes * 60
+        self.edge = self.rng.uniform(-0.15, 0.15)   # >0: blue is stronger
+        self.time = 0
+        self.events = [{'EventID': 0, 'EventName': 'GameStart', 'EventTime': 0.0}]
+        self.players = []
+        for i in range(2 * TEAM_SIZE):
+            team = 'ORDER' if i < TEAM_SIZE else 'CHAOS'
+            name = f"{'Blue' if team == 'ORDER' else 'Red'}{i % TEAM_SIZE + 1}"
+            self.players.append({
+                'summonerName': name, 'riotId': f'{name}#MOCK', 'riotIdGameName': name,
+                'team': team, 'championName': f'Champion{i}', 'position': '',
+                'level': 1, 'isDead': False, 'respawnTimer': 0.0, 'isBot': False,
+                'items': [], 'gold': 500.0,
+                'scores': {'kills': 0, 'deaths': 0, 'assists': 0, 'creepScore': 0, 'wardScore': 0.0},
+            })
+        self.turrets = {'ORDER': list(TURRETS), 'CHAOS': list(TURRETS)}
+        self.inhibs = {'ORDER': list(INHIBS), 'CHAOS': list(INHIBS)}
+        self.next_dragon, self.next_baron, self.herald_up = DRAGON_START, BARON_START, True
+
+    def event(self, name, **fields):
+        self.events.append(dict(EventID=len(self.events), EventName=name, EventTime=float(self.time), **fields))
+
+    def winner_of(self, bias=1.0):
+        return 'ORDER' if self.rng.random() < 0.5 + self.edge * bias else 'CHAOS'
+
+    def team(self, team, alive=True):
+        return [p for p in self.players if p['team'] == team and (not alive or not p['isDead'])]
+
+    def step(self):
+        self.time += 1
+        t = self.time
+        if t == 65:
+            self.event('MinionsSpawning')
+
+        for p in self.players:
+            if p['isDead']:
+                p['respawnTimer'] = max(0.0, p['respawnTimer'] - 1)
+                if p['respawnTimer'] == 0:
+                    p['isDead'] = False
+                continue
+            if t > 90 and self.rng.random() < 0.12:
+                p['scores']['creepScore'] += 1
+            p['gold'] += 2.1 + (20 if t > 90 and self.rng.random() < 0.12 else 0)
+            if p['gold'] >= ITEM_PRICE and len(p['items']) < 6:
+                p['gold'] -= ITEM_PRICE
+                p['items'].append({'itemID': 3000 + len(p['items']), 'price': ITEM_PRICE,
+                                   'displayName': f'Item {len(p["items"]) + 1}', 'count': 1, 'slot': len(p['items'])})
+            p['level'] = min(18, 1 + int((t / 60) ** 0.85))
+
+        # skirmishes
+        if t > 120 and self.rng.random() < 0.02:
+            winner = self.winner_of()
+            loser = 'CHAOS' if winner == 'ORDER' else 'ORDER'
+            killers, victims = self.team(winner), self.team(loser)
+            if killers and victims:
+                killer, victim = self.rng.choice(killers), self.rng.choice(victims)
+                assisters = [a['riotId'] for a in self.rng.sample(killers, min(len(killers) - 1, 2)) if a is not killer]
+                killer['scores']['kills'] += 1
+                killer['gold'] += 300
+                victim['scores']['deaths'] += 1
+                victim['isDead'] = True
+                victim['respawnTimer'] = 6.0 + 2.5 * victim['level']
+                for a in self.players:
+                    if a['riotId'] in assisters:
+                        a['scores']['assists'] += 1
+                self.event('ChampionKill', KillerName=killer['riotId'], VictimName=victim['riotId'],
+                           Assisters=assisters)
+
+        # structures (Turret_T1_* belongs to blue, so it's red that took it)
+        if t > 600 and self.rng.random() < 0.006:
+            taker = self.winner_of(bias=2)
+            owner = 'CHAOS' if taker == 'ORDER' else 'ORDER'
+            tag = 'T1' if owner == 'ORDER' else 'T2'
+            killer = self.rng.choice(self.team(taker, alive=False))
+            if self.turrets[owner]:
+                self.event('TurretKilled', TurretKilled=f'Turret_{tag}_{self.turrets[owner].pop(0)}',
+                           KillerName=killer['riotId'], Assisters=[])
+            elif self.inhibs[owner]:
+                self.event('InhibKilled', InhibKilled=f'Barracks_{tag}_{self.inhibs[owner].pop(0)}',
+                           KillerName=killer['riotId'], Assisters=[])
+
+        # objectives
+        if t >= self.next_dragon:
+            killer = self.rng.choice(self.team(self.winner_of(), alive=False))
+            self.event('DragonKill', DragonType=self.rng.choice(['Fire', 'Water', 'Earth', 'Air']),
+                       Stolen='False', KillerName=killer['riotId'], Assisters=[])
+            self.next_dragon = t + DRAGON_RESPAWN + self.rng.randint(0, 60)
+        if self.herald_up and t >= HERALD_START + self.rng.randint(0, 120) and t < BARON_START:
+            killer = self.rng.choice(self.team(self.winner_of(), alive=False))
+            self.event('HeraldKill', Stolen='False', KillerName=killer['riotId'], Assisters=[])
+            self.herald_up = False
+        if t >= self.next_baron:
+            killer = self.rng.choice(self.team(self.winner_of(bias=2), alive=False))
+            self.event('BaronKill', Stolen='False', KillerName=killer['riotId'], Assisters=[])
+            self.next_baron = t + BARON_RESPAWN + self.rng.randint(0, 60)
+
+    def snapshot(self, game_time, seat=0):
+        """allgamedata at game_time as seen by players[seat] (the simulation only ever moves forward)"""
+        game_time = min(game_time, self.duration)
+        if int(game_time) < self.time:
+            # looped: replay the same game from the start (in place, so every seat view sees it)
+            self.__init__(self.seed, self.minutes)
+        while self.time < int(game_time):
+            self.step()
+
+        me = self.players[seat]
+        players = []
+        for p in self.players:
+            entry = {k: v for k, v in p.items() if k != 'gold'}
+            entry['scores'] = dict(p['scores'])
+            entry['items'] = list(p['items'])
+            players.append(entry)
+        return {
+            'activePlayer': {
+                'summonerName': me['summonerName'], 'riotId': me['riotId'], 'riotIdGameName': me['riotIdGameName'],
+                'level': me['level'], 'currentGold': round(me['gold'], 1),
+                'championStats': {
+                    'currentHealth': 0.0 if me['isDead'] else round(self.rng.uniform(0.2, 1.0) * (600 + 90 * me['level']), 1),
+                    'maxHealth': 600.0 + 90 * me['level'],
+                },
+            },
+            'allPlayers': players,
+            'events': {'Events': list(self.events)},
+            'gameData': {'gameMode': 'CLASSIC', 'gameTime': float(game_time), 'mapName': 'Map11',
+                         'mapNumber': 11, 'mapTerrain': 'Default'},
+        }
+
+
+class RecordedGame:
+    """Snapshots from a live_recorder .lrec log, looked up by game time"""
+
+    def __init__(self, path):
+        from live_recorder import Recording
+        self.frames = list(Recording(path))
+        if not self.frames:
+            raise ValueError(f"{path} has no snapshots")
+        self.duration = self.frames[-1][0]
+        self.position = 0
+
+    def snapshot(self, game_time, seat=0):
+        # only the recorded player's activePlayer block exists, so every seat gets it
+        if game_time < self.frames[self.position][0]:
+            self.position = 0   # looped
+        while self.position + 1 < len(self.frames) and self.frames[self.position + 1][0] <= game_time:
+            self.position += 1
+        return self.frames[self.position][2]
+
+
+class MockLiveClient:
+    """The game clock plus the knobs shared by every request handler"""
+
+    def __init__(self, game, speed=1.0, loading_sec=LOADING_SEC, loop=False, latency_ms=0.0, jitter_ms=0.0,
+                 pad_kb=0, error_rate=0.0, garbage_rate=0.0, hang_rate=0.0, hang_ms=5000, drop_rate=0.0, seed=0):
+        self.game = game
+        self.speed = speed
+        self.loading_sec = loading_sec
+        self.loop = loop
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.padding = 'x' * (pad_kb * 1024)
+        self.error_rate = error_rate
+        self.garbage_rate = garbage_rate
+        self.hang_rate = hang_rate
+        self.hang_ms = hang_ms
+        self.drop_rate = drop_rate
+
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.stats = Counter()
+        self.seat = 0
+
+    def seat_view(self, seat):
+        """Same game, clock, knobs and counters, seen by another player (one per port)"""
+        view = copy.copy(self)
+        view.seat = seat
+        return view
+
+    def game_time(self):
+        """Seconds into the game, or None while 'loading'"""
+        elapsed = time.monotonic() - self.started - self.loading_sec
+        if elapsed < 0:
+            return None
+        game_time = elapsed * self.speed
+        if self.loop:
+            game_time %= self.game.duration
+        return game_time
+
+    def snapshot(self):
+        game_time = self.game_time()
+        if game_time is None:
+            return None
+        with self.lock:
+            return self.game.snapshot(game_time, self.seat)
+
+    def fault(self):
+        """Pick this request's injected failure (or None)"""
+        roll = self.rng.random()
+        for name, rate in (('error', self.error_rate), ('garbage', self.garbage_rate),
+                           ('hang', self.hang_rate), ('drop', self.drop_rate)):
+            if roll < rate:
+                return name
+            roll -= rate
+        return None
+
+    def delay(self):
+        ms = self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if ms > 0:
+            time.sleep(ms / 1000)
+
+    def endpoint(self, name, query):
+        """(status, body) for /liveclientdata/<name>"""
+        data = self.snapshot()
+        if data is None:
+            return 404, b'{"errorCode":"RESOURCE_NOT_FOUND","httpStatus":404,"message":"No game in progress"}'
+
+        if name == 'allgamedata':
+            body = dict(data, _padding=self.padding) if self.padding else data
+        elif name == 'activeplayer':
+            body = data['activePlayer']
+        elif name == 'activeplayername':
+            body = data['activePlayer'].get('riotId') or data['activePlayer'].get('summonerName')
+        elif name == 'playerlist':
+            team = query.get('teamID', [None])[0]
+            body = [p for p in data['allPlayers'] if team is None or p.get('team') == team]
+        elif name == 'eventdata':
+            since = int(query.get('eventID', ['0'])[0])
+            body = {'Events': [e for e in data['events']['Events'] if e.get('EventID', 0) >= since]}
+        elif name == 'gamestats':
+            body = data['gameData']
+        else:
+            return 404, b'{"errorCode":"RESOURCE_NOT_FOUND","httpStatus":404}'
+        return 200, json.dumps(body, separators=(',', ':')).encode()
+
+
+def make_handler(mock):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'   # keep-alive, like the real client
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def send_body(self, status, body, content_type='application/json'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/mock/stats':
+                with mock.lock:
+                    stats = dict(mock.stats)
+                self.send_body(200, json.dumps(stats).encode())
+                return
+            if not url.path.startswith('/liveclientdata/'):
+                self.send_body(404, b'{}')
+                return
+
+            name = url.path[len('/liveclientdata/'):]
+            mock.delay()
+            fault = mock.fault()
+            with mock.lock:
+                mock.stats[f'requests.{name}'] += 1
+                mock.stats[f'outcome.{fault or "ok"}'] += 1
+
+            if fault == 'drop':
+                self.close_connection = True
+                self.connection.close()
+                return
+            if fault == 'hang':
+                time.sleep(mock.hang_ms / 1000)
+            if fault == 'error':
+                self.send_body(503, b'Service Unavailable', 'text/plain')
+                return
+            if fault == 'garbage':
+                # what the client serves while champ select / loading is wrapping up
+                self.send_body(200, b'<html>loading</html>', 'text/html')
+                return
+
+            status, body = mock.endpoint(name, parse_qs(url.query))
+            self.send_body(status, body)
+
+    return Handler
+
+
+def serve(mock, host='127.0.0.1', port=PORT, cert=None, key=None):
+    """Start a server thread for mock; returns the server (call .shutdown() to stop)"""
+    server = ThreadingHTTPServer((host, port), make_handler(mock))
+    server.daemon_threads = True
+    if cert:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock League Live Client Data API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--seats', type=int, default=1,
+                        help="serve the game to this many players on consecutive ports (coach_aggregator.py)")
+    parser.add_argument('--recording', metavar='LREC', help="serve a recorded game instead of a synthetic one")
+    parser.add_argument('--seed', type=int, default=0, help="synthetic game / fault injection seed")
+    parser.add_argument('--minutes', type=float, default=GAME_MINUTES, help="synthetic game length")
+    parser.add_argument('--speed', type=float, default=1.0, help="game seconds per wall second")
+    parser.add_argument('--start', type=float, default=0.0, metavar='SEC', help="start at this game time")
+    parser.add_argument('--loop', action='store_true', help="restart the game when it ends")
+    parser.add_argument('--loading-sec', type=float, default=LOADING_SEC,
+                        help="answer 404 like the loading screen for this long first")
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--pad-kb', type=int, default=0, help="extra bytes added to every allgamedata payload")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests answered 503")
+    parser.add_argument('--garbage-rate', type=float, default=0.0, help="fraction answered with non-JSON")
+    parser.add_argument('--hang-rate', type=float, default=0.0, help="fraction delayed by --hang-ms")
+    parser.add_argument('--hang-ms', type=float, default=5000)
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="fraction whose connection is closed")
+    parser.add_argument('--cert', help="PEM certificate; serve https like the real client")
+    parser.add_argument('--key', help="PEM private key for --cert")
+    args = parser.parse_args()
+
+    game = RecordedGame(args.recording) if args.recording else SyntheticGame(args.seed, args.minutes)
+    mock = MockLiveClient(
+        game, speed=args.speed, loading_sec=args.loading_sec, loop=args.loop,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, pad_kb=args.pad_kb,
+        error_rate=args.error_rate, garbage_rate=args.garbage_rate,
+        hang_rate=args.hang_rate, hang_ms=args.hang_ms, drop_rate=args.drop_rate, seed=args.seed,
+    )
+    mock.started -= args.start / args.speed
+
+    servers = [serve(mock.seat_view(seat), args.host, args.port + seat, args.cert, args.key)
+               for seat in range(args.seats)]
+    scheme = 'https' if args.cert else 'http'
+    print(f"🎮 Mock live client on {scheme}://{args.host}:{args.port} "
+          f"({'recording' if args.recording else 'synthetic game'}, {args.speed:g}x)")
+    if args.seats > 1:
+        print(f"   {args.seats} seats on ports {args.port}-{args.port + args.seats - 1}")
+    print(f"   LIVE_CLIENT_URL={scheme}://{args.host}:{args.port}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+        print(f"📊 {dict(mock.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#OpenAI-compatible chat completions stub for testing tips without a key
+#
+#   python openai_stub_server.py --first-token-ms 250 --token-ms 30
+#   OPENROUTER_BASE_URL=http://127.0.0.1:8799/v1 OPENROUTER_API_KEY=stub python lol_overlay.py
+#
+#POST .../chat/completions answers with canned tips, either as one JSON body
+#or (stream=true) as server-sent events one word at a time, so time-to-first-
+#token and total time can be measured against known delays.
+
+import argparse
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ---------- CONFIG ----------
+PORT = 8799
+FIRST_TOKEN_MS = 250
+TOKEN_MS = 30
+# ----------------------------
+
+CANNED_TIPS = [
+    "1. Group mid and siege with the wave.\n2. Ward enemy jungle before Baron.\n3. Kite their frontline, focus the carry.",
+    "1. Trade side lanes, don't force 5v5.\n2. Stack vision around the next dragon.\n3. Catch the lone split-pusher and reset.",
+    "1. Freeze bot and deny their ADC farm.\n2. Contest Herald with jungle priority.\n3. Play around your strongest lane.",
+]
+
+
+def completion_chunk(model, content=None, finish_reason=None):
+    delta = {} if content is None else {'role': 'assistant', 'content': content}
+    return {
+        'id': 'chatcmpl-stub', 'object': 'chat.completion.chunk', 'created': int(time.time()), 'model': model,
+        'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+    }
+
+
+def make_handler(first_token_ms, token_ms, error_rate):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def send_json(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def write_chunk(self, data):
+            # HTTP/1.1 chunked transfer framing
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not self.path.endswith('/chat/completions'):
+                self.send_json(404, {'error': {'message': 'not found'}})
+                return
+            if random.random() < error_rate:
+                self.send_json(503, {'error': {'message': 'stub overloaded'}})
+                return
+
+            model = request.get('model', 'stub')
+            text = random.choice(CANNED_TIPS)
+            time.sleep(first_token_ms / 1000)
+
+            if not request.get('stream'):
+                time.sleep(token_ms * len(text.split(' ')) / 1000)
+                self.send_json(200, {
+                    'id': 'chatcmpl-stub', 'object': 'chat.completion', 'created': int(time.time()), 'model': model,
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                    'usage': {'prompt_tokens': 0, 'completion_tokens': len(text.split()), 'total_tokens': len(text.split())},
+                })
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            try:
+                words = text.split(' ')
+                for i, word in enumerate(words):
+                    if i:
+                        time.sleep(token_ms / 1000)
+                    token = word if i == 0 else ' ' + word
+                    self.write_chunk(f"data: {json.dumps(completion_chunk(model, token))}\n\n".encode())
+                self.write_chunk(f"data: {json.dumps(completion_chunk(model, finish_reason='stop'))}\n\n".encode())
+                self.write_chunk(b"data: [DONE]\n\n")
+                self.write_chunk(b"")
+            except OSError:
+                self.close_connection = True   # client hung up mid-stream (superseded request)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub for tip latency tests")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--first-token-ms', type=float, default=FIRST_TOKEN_MS)
+    parser.add_argument('--token-ms', type=float, default=TOKEN_MS)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port),
+                                 make_handler(args.first_token_ms, args.token_ms, args.error_rate))
+    server.daemon_threads = True
+    print(f"🤖 OpenAI stub on http://{args.host}:{args.port}/v1 "
+          f"(first token {args.first_token_ms:g}ms, then {args.token_ms:g}ms/token)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
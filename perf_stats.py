@@ -0,0 +1,97 @@
+#per-stage latency for the overlay's hot path
+#
+#the monitor thread feeds every tick's LiveSnapshot.timings_ms in (http,
+#decode, parse, each model stage), the Tk side times its own rendering, and
+#tips add their time-to-first-token. Each stage keeps a rolling window
+#(live_engine.TimingStats) for p50/p99. F12 in the overlay shows the table;
+#`--perf-log FILE` appends a JSON line every PERF_DUMP_SEC so a player can send
+#the file in when the overlay feels slow.
+#
+#   python perf_stats.py perf.jsonl      # per-stage p50/p99 over a dumped session
+
+import argparse
+import json
+import threading
+import time
+
+from live_engine import TimingStats
+
+# ---------- CONFIG ----------
+PERF_DUMP_SEC = 30
+# stages in the order data flows through them; anything else is listed after
+STAGE_ORDER = ('http', 'decode', 'poll', 'parse', 'blue_win_prob', 'death_risk',
+               'render_stats', 'render_chart', 'tips_ttft', 'tips_total')
+# ----------------------------
+
+
+class PerfStats:
+    """Thread-safe {stage: TimingStats}"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.started = time.time()
+
+    def add(self, stage, ms):
+        with self.lock:
+            timing = self.stages.get(stage)
+            if timing is None:
+                timing = self.stages[stage] = TimingStats()
+            timing.add(ms)
+
+    def add_all(self, timings_ms):
+        for stage, ms in timings_ms.items():
+            self.add(stage, ms)
+
+    def summary(self):
+        with self.lock:
+            stats = {stage: timing.summary() for stage, timing in self.stages.items()}
+        ordered = [s for s in STAGE_ORDER if s in stats] + sorted(s for s in stats if s not in STAGE_ORDER)
+        return {stage: stats[stage] for stage in ordered}
+
+    def dump(self, path, **extra):
+        """Append one JSON line with the current summary (plus extra fields)"""
+        record = {'time': time.time(), 'uptime_sec': time.time() - self.started, **extra,
+                  'stages': self.summary()}
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+def format_table(summary):
+    """Monospace text for the debug panel"""
+    lines = [f"{'stage':<14}{'p50':>8}{'p99':>8}{'n':>7}"]
+    for stage, s in summary.items():
+        if not s.get('calls'):
+            continue
+        lines.append(f"{stage:<14}{s['p50_ms']:>8.2f}{s['p99_ms']:>8.2f}{s['calls']:>7}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize an overlay --perf-log file")
+    parser.add_argument('log')
+    args = parser.parse_args()
+
+    with open(args.log, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if not records:
+        print(f"✗ {args.log} is empty")
+        return
+
+    # worst p99 seen per stage across the session, next to the final window
+    worst = {}
+    for record in records:
+        for stage, s in record['stages'].items():
+            if s.get('calls'):
+                worst[stage] = max(worst.get(stage, 0.0), s['p99_ms'])
+
+    last = records[-1]['stages']
+    print(f"📊 {args.log}: {len(records)} dumps over {records[-1]['uptime_sec'] / 60:.1f} min")
+    print(f"  {'stage':<14}{'p50':>8}{'p99':>8}{'worst p99':>11}{'calls':>8}")
+    for stage, s in last.items():
+        if s.get('calls'):
+            print(f"  {stage:<14}{s['p50_ms']:>8.2f}{s['p99_ms']:>8.2f}{worst[stage]:>11.2f}{s['calls']:>8}")
+
+
+if __name__ == "__main__":
+    main()
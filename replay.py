@@ -0,0 +1,177 @@
+#replay recorded games (live_recorder.py) through the live pipeline
+#
+#ReplayPoller is a LiveClientPoller that serves a recording instead of port
+#2999, paced by the recorded game clock at any speed (0 = unthrottled). The
+#driver below runs each tick through the same LiveEngine the overlay and
+#live_server use and times every stage:
+#   poll           next snapshot (decode + delta patch here; HTTP + JSON when live)
+#   parse          LiveSnapshot: team stats, objectives, local player
+#   blue_win_prob  win model stage
+#   death_risk     death-risk model stage
+#   render         StatsOverlay.display_stats + Tk redraw (--render, needs a display)
+#
+#   python replay.py recordings/game_20250101-200000.lrec               # unthrottled
+#   python replay.py recordings/ --speed 10 --render                     # watch at 10x
+#   python lol_overlay.py --replay recordings/game_....lrec --speed 10   # the real overlay
+
+import argparse
+import csv
+import os
+import time
+
+import numpy as np
+import requests
+
+from live_client import LiveClientPoller
+from live_engine import DeathRiskStage, LiveEngine, WinProbabilityStage
+from live_recorder import Recording, list_recordings
+from win_model import LiveScorer, load_live_model
+
+
+class ReplayPoller(LiveClientPoller):
+    """Serves recorded snapshots; poll()/state/sleep() behave like the live poller"""
+
+    def __init__(self, path, speed=1.0, start_time=None, checkpoints_min=(), intervals=None):
+        super().__init__(base_url='replay://' + path, checkpoints_min=checkpoints_min, intervals=intervals)
+        self.speed = speed
+        self.frames = Recording(path).snapshots(start_time)
+        self.upcoming = next(self.frames, None)
+        self.current_time = None
+        self.polled_at = None
+        self.finished = self.upcoming is None
+
+    def fetch(self, endpoint='allgamedata', params=None):
+        if self.upcoming is None:
+            self.finished = True
+            self.failures += 1
+            self.state = 'absent'
+            self.last_error = requests.ConnectionError('replay finished')
+            raise self.last_error
+
+        game_time, _, data = self.upcoming
+        self.upcoming = next(self.frames, None)
+        self.current_time = game_time
+        self.polled_at = time.perf_counter()
+        self.failures = 0
+        self.classify(data)
+        return True, data
+
+    def sleep(self):
+        """Wait out the recorded gap to the next snapshot, scaled by speed"""
+        if self.finished:
+            return super().sleep()   # back off like an absent client
+        if self.upcoming is None or not self.speed:
+            return
+        due = self.polled_at + (self.upcoming[0] - self.current_time) / self.speed
+        self.stop_event.wait(max(0.0, due - time.perf_counter()))
+
+
+def make_overlay(poller):
+    """Real StatsOverlay without its monitor thread, or None without a display"""
+    import tkinter as tk
+    try:
+        from lol_overlay import StatsOverlay
+        return StatsOverlay(poller=poller, monitor=False)
+    except tk.TclError as e:
+        print(f"⚠ No display, skipping the render stage: {e}")
+        return None
+
+
+def replay(path, stages, speed=0.0, start_time=None, render=False):
+    """Run one recording through a LiveEngine; returns (per-tick timings, wall seconds)"""
+    poller = ReplayPoller(path, speed=speed, start_time=start_time)
+    engine = LiveEngine(poller, stages=stages)
+    app = make_overlay(poller) if render else None
+    ticks = []
+    started = time.perf_counter()
+
+    while True:
+        t0 = time.perf_counter()
+        snapshot = engine.tick()
+        if snapshot is None:
+            break
+        t1 = time.perf_counter()
+
+        blue_prob = snapshot.predictions.get('blue_win_prob')
+        if app is not None:
+            bp = 0.5 if blue_prob is None else blue_prob
+            app.display_stats(snapshot.blue, snapshot.red, snapshot.game_time, bp, 1.0 - bp,
+                              snapshot.player_team, checkpoint=False)
+            app.root.update()
+        t2 = time.perf_counter()
+
+        tick = {'game_time': snapshot.game_time}
+        tick.update({f'{name}_ms': ms for name, ms in snapshot.timings_ms.items()})
+        tick['render_ms'] = (t2 - t1) * 1000 if app is not None else None
+        tick['total_ms'] = (t2 - t0) * 1000
+        tick.update(snapshot.predictions)
+        ticks.append(tick)
+        poller.sleep()
+
+    wall_sec = time.perf_counter() - started
+    if app is not None:
+        app.root.destroy()
+    poller.stop()
+    return ticks, wall_sec
+
+
+def print_report(name, ticks, stage_names, wall_sec):
+    if not ticks:
+        print(f"✗ {name}: no snapshots")
+        return
+    game_sec = ticks[-1]['game_time'] - ticks[0]['game_time']
+    print(f"\n📊 {name}: {len(ticks)} ticks, {game_sec / 60:.1f} game minutes in {wall_sec:.2f}s "
+          f"({len(ticks) / wall_sec:,.0f} ticks/s, {game_sec / wall_sec:,.0f}x real time)")
+    print(f"   {'stage':14s} {'mean':>8s} {'p50':>8s} {'p99':>8s} {'max':>8s}  (ms)")
+    for stage in ['poll', 'parse'] + stage_names + ['render', 'total']:
+        values = [t[f'{stage}_ms'] for t in ticks if t.get(f'{stage}_ms') is not None]
+        if not values:
+            print(f"   {stage:14s} {'skipped':>8s}")
+            continue
+        v = np.array(values)
+        print(f"   {stage:14s} {v.mean():8.3f} {np.percentile(v, 50):8.3f} "
+              f"{np.percentile(v, 99):8.3f} {v.max():8.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded games through the live pipeline")
+    parser.add_argument('recording', help=".lrec file or a directory of them")
+    parser.add_argument('--speed', type=float, default=0.0,
+                        help="1 = real time, 10 = 10x, 0 = unthrottled (default)")
+    parser.add_argument('--start', type=float, default=None, metavar='SEC',
+                        help="start at this game time (seeks via the keyframe index)")
+    parser.add_argument('--render', action='store_true', help="also draw the overlay panel every tick")
+    parser.add_argument('--csv', metavar='PATH', help="write per-tick timings here")
+    args = parser.parse_args()
+
+    paths = list_recordings(args.recording)
+    if not paths:
+        print(f"✗ No recordings in {args.recording}")
+        return
+
+    stages = []
+    try:
+        stages.append(WinProbabilityStage(LiveScorer(load_live_model())))
+    except Exception as e:
+        print(f"⚠ Win model unavailable, skipping its stage: {e}")
+    death_stage = DeathRiskStage.load()
+    if death_stage is not None:
+        stages.append(death_stage)
+    stage_names = [stage.name for stage in stages]
+
+    rows = []
+    for path in paths:
+        ticks, wall_sec = replay(path, stages, args.speed, args.start, args.render)
+        print_report(os.path.basename(path), ticks, stage_names, wall_sec)
+        rows.extend(dict(t, recording=os.path.basename(path)) for t in ticks)
+
+    if args.csv and rows:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"💾 Saved per-tick timings to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,26 @@
-import requests
-import urllib3
+import os
+import sys
 import joblib
 import numpy as np
-import time
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# shared live client poller lives at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from live_client import LiveClientPoller, all_players, player_name
 
-LIVE_URL = "http://127.0.0.1:2999/liveclientdata/allgamedata"
 MODEL_FILE = "death_model.pkl"
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), MODEL_FILE)
 
-def get_live_snapshot():
-    """
-    Grab current frame from the League liveclientdata API.
-    Return a dict of your player's features, or None.
-    """
-    try:
-        r = requests.get(LIVE_URL, verify=False, timeout=0.5)
-        r.raise_for_status()
-        raw = r.json()
-    except Exception as e:
-        print("[warn] could not read live client:", repr(e))
-        return None
+# keep-alive session; backs off when the client is gone, slows down while dead
+poller = LiveClientPoller(timeout=0.5, intervals={'live': 1.0})
 
-    # DEBUG: show top-level keys once so we know what mode we're in
-    # (activePlayer missing = you're spectating or the game hasn't started)
-    if not isinstance(raw, dict):
-        print("[debug] raw was not dict:", type(raw))
-        return None
-    missing_keys = []
-    if "activePlayer" not in raw:
-        missing_keys.append("activePlayer")
-    if "allPlayers" not in raw:
-        missing_keys.append("allPlayers")
-    if missing_keys:
-        print("[debug] missing keys from live data:", missing_keys)
-        # if activePlayer is missing we literally cannot get hp_pct
-        return None
 
-    me = raw.get("activePlayer", {}) or {}
+def player_features(me, player, verbose=True):
+    """
+    Feature dict from the activePlayer block and your own allPlayers entry
+    (live_client.find_active_player), or None. live_engine calls this directly
+    on its parsed snapshot. Only this script's main() keeps the [debug] lines
+    on; the overlay, live_server and coach_aggregator would print them every tick.
+    """
     stats = me.get("championStats", {}) or {}
 
     # hp%
@@ -51,45 +34,19 @@ def get_live_snapshot():
     level = me.get("level")
     gold = me.get("currentGold")
 
-    you_name = (
-        me.get("summonerName")
-        or me.get("riotId")
-        or me.get("riotIdGameName")
-    )
-
     kills = deaths = assists = cs = None
 
-    ap_list = raw.get("allPlayers", [])
-    if isinstance(ap_list, dict):
-        ap_list = list(ap_list.values())
-
-    # find yourself in allPlayers to get scoreboard stuff
-    found_self = False
-    for p in ap_list:
-        pname = (
-            p.get("summonerName")
-            or p.get("riotId")
-            or p.get("riotIdGameName")
-        )
-        if pname == you_name:
-            found_self = True
-            scores = p.get("scores", {}) or {}
-            kills = scores.get("kills")
-            deaths = scores.get("deaths")
-            assists = scores.get("assists")
-            cs = scores.get("creepScore")
-            break
-
-    # debug if we couldn't match your name in allPlayers
-    if not found_self:
-        print("[debug] couldn't match self in allPlayers. you_name=", you_name)
-        print("[debug] available names:", [
-            (
-                q.get("summonerName")
-                or q.get("riotId")
-                or q.get("riotIdGameName")
-            ) for q in ap_list
-        ])
+    # scoreboard stuff comes from your allPlayers entry
+    if player is not None:
+        scores = player.get("scores", {}) or {}
+        kills = scores.get("kills")
+        deaths = scores.get("deaths")
+        assists = scores.get("assists")
+        cs = scores.get("creepScore")
+    else:
+        # debug if we couldn't match your name in allPlayers
+        if verbose:
+            print("[debug] couldn't match self in allPlayers. you_name=", player_name(me))
 
     feats = {
         "hp_pct": hp_pct,
@@ -103,11 +60,12 @@ def get_live_snapshot():
 
     # sanity: do we at least have hp_pct and level?
     if hp_pct is None or level is None:
-        print("[debug] missing hp_pct/level. feats now =", feats)
+        if verbose:
+            print("[debug] missing hp_pct/level. feats now =", feats)
         return None
 
     # sanity: did we fail to get deaths/kills/etc?
-    if deaths is None:
+    if deaths is None and verbose:
         print("[debug] scoreboard not linked yet. feats now =", feats)
         # we won't bail here; we'll just fill defaults below
 
@@ -122,23 +80,22 @@ def get_live_snapshot():
 
 
 
-def load_model():
+def load_model(model_file=MODEL_FILE):
     """
     Load scaler + classifier + feature order from death_model.pkl
     """
-    bundle = joblib.load(MODEL_FILE)
+    bundle = joblib.load(model_file)
     scaler = bundle["scaler"]
     clf = bundle["clf"]
     feature_cols = bundle["feature_cols"]
     return scaler, clf, feature_cols
 
 
-def predict_risk(scaler, clf, feature_cols, feats_now):
+def feature_row(feature_cols, feats_now):
     """
-    Take the current feature dict from get_live_snapshot(),
-    run it through the scaler+model, return probability of death in 10s.
+    Model input row (in feature_cols order) for one feature dict, or None
+    if something the model needs is missing.
     """
-    # Make sure all required features are present
     row = []
     for col in feature_cols:
         val = feats_now.get(col)
@@ -154,34 +111,75 @@ def predict_risk(scaler, clf, feature_cols, feats_now):
             return None
 
         row.append(val)
+    return row
+
+
+def risk_probs(clf, x):
+    """P(death in 10s) for every row of the scaled matrix x"""
+    if hasattr(clf, "predict_proba"):
+        return clf.predict_proba(x)[:, 1]
+    score = clf.decision_function(x)
+    return 1 / (1 + np.exp(-score))
+
+
+def predict_risk(scaler, clf, feature_cols, feats_now):
+    """
+    Take the current feature dict from player_features(),
+    run it through the scaler+model, return probability of death in 10s.
+    """
+    row = feature_row(feature_cols, feats_now)
+    if row is None:
+        return None
 
     x_raw = np.array([row], dtype=float)
     x = scaler.transform(x_raw)
+    return float(risk_probs(clf, x)[0])
 
-    if hasattr(clf, "predict_proba"):
-        prob = clf.predict_proba(x)[0, 1]
-    else:
-        score = clf.decision_function(x)[0]
-        prob = 1 / (1 + np.exp(-score))
 
-    return float(prob)
+def predict_risk_batch(scaler, clf, feature_cols, feats_list):
+    """
+    predict_risk for several players at once (coach_aggregator.py): one
+    scaler/model call for every row that can be scored, None for the rest.
+    """
+    rows = [None if feats is None else feature_row(feature_cols, feats) for feats in feats_list]
+    scored = [i for i, row in enumerate(rows) if row is not None]
+    probs = [None] * len(rows)
+    if scored:
+        x = scaler.transform(np.array([rows[i] for i in scored], dtype=float))
+        for i, prob in zip(scored, risk_probs(clf, x)):
+            probs[i] = float(prob)
+    return probs
 
 
 def main():
+    # same engine the overlay / live_server use; this script just runs it
+    # with the death-risk stage only
+    from live_engine import DeathRiskStage, LiveEngine
+
     print("[info] loading model...")
     try:
-        scaler, clf, feature_cols = load_model()
+        stage = DeathRiskStage(load_model(MODEL_PATH), verbose=True)
     except Exception as e:
         print("[fatal] couldn't load model:", e)
         return
+    engine = LiveEngine(poller, stages=[stage])
 
     print("[info] starting live loop. Ctrl+C to stop.")
     while True:
-        feats = get_live_snapshot()
-        if feats is None:
+        snapshot = engine.tick()
+        if snapshot is None:
+            print("[warn] could not read live client:", repr(poller.last_error))
             print("no live data yet (are you in game / alive?)")
         else:
-            prob = predict_risk(scaler, clf, feature_cols, feats)
+            # DEBUG: activePlayer missing = you're spectating or the game hasn't started
+            missing_keys = [k for k in ("activePlayer", "allPlayers") if k not in snapshot.raw]
+            if missing_keys:
+                print("[debug] missing keys from live data:", missing_keys)
+            elif snapshot.player is None:
+                print("[debug] available names:", [player_name(q) for q in all_players(snapshot.raw)])
+
+            prob = snapshot.predictions[stage.name]
+            feats = stage.last_features
             if prob is None:
                 print("not enough info to score yet")
             else:
@@ -201,7 +199,7 @@ def main():
                 # print nice line
                 print(f"HP={feats['hp_pct']:.2f} lvl={feats['level']} deaths={feats['deaths']} gold={feats['gold']:.0f}  → death risk {pct:5.1f}% [{status}]")
 
-        time.sleep(1.0)
+        poller.sleep()
 
 
 if __name__ == "__main__":
@@ -1,18 +1,25 @@
 print("HEHEHEHA (script loaded)")  # sanity check at import time
 
-import time
-import requests
-import urllib3
+import os
+import sys
 from collections import deque
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# shared live client poller lives at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from live_client import LiveClientPoller
+from live_events import KillIndex
+from live_recorder import LiveRecorder
 
-# IMPORTANT: your curl output showed this endpoint works.
-# Keep https, and verify=False to ignore cert.
-LIVE_URL = "https://127.0.0.1:2999/liveclientdata/allgamedata"
+# keep-alive https session (verify=False) with adaptive intervals; 1s while
+# alive and fighting so labels keep their resolution
+poller = LiveClientPoller(timeout=1.0, intervals={'live': 1.0, 'fight': 1.0, 'dead': 1.0})
 
-# rolling buffers
-recent_kill_events = deque(maxlen=200)
+# every raw snapshot also goes to a compressed per-game log (recordings/),
+# so the rows below can be rebuilt offline with a different feature set
+recorder = LiveRecorder()
+
+# every ChampionKill seen this game, once per EventID, as sorted death times per victim
+kill_index = KillIndex()
 
 # recent_frames keeps (game_time, snapshot_at_that_time) so we can label them ~10s later
 recent_frames = deque(maxlen=60)
@@ -28,15 +35,7 @@ def safe_get_live_json():
 
     ok = True if it's valid JSON and we could r.json() it.
     """
-    r = requests.get(LIVE_URL, verify=False, timeout=1.0)
-    r.raise_for_status()
-
-    try:
-        data = r.json()
-        return True, data
-    except ValueError:
-        # response wasn't valid JSON
-        return False, r.text
+    return poller.fetch()
 
 
 def parse_snapshot(raw):
@@ -58,21 +57,14 @@ def parse_snapshot(raw):
             "hp_pct": ...,
         }
 
-    Also updates recent_kill_events from raw["events"].
+    Also indexes any new kills from raw["events"] into kill_index.
     """
 
     # game time
     game_time = raw.get("gameData", {}).get("gameTime", 0.0)
 
-    # 1. Update kill history
-    events_raw = raw.get("events", {}).get("Events", [])
-    for ev in events_raw:
-        if ev.get("EventName") == "ChampionKill":
-            recent_kill_events.append({
-                "time": ev.get("EventTime", 0.0),
-                "killer": ev.get("KillerName"),
-                "victim": ev.get("VictimName"),
-            })
+    # 1. Update kill history (only events newer than the last tick are looked at)
+    kill_index.update(raw)
 
     snapshot = {}
 
@@ -148,18 +140,12 @@ def parse_snapshot(raw):
 
 def will_die_within(player_name, start_t, horizon_sec=10):
     """
-    Look at our rolling kill log. Return 1 if player_name
+    Look at our kill index. Return 1 if player_name
     died between [start_t, start_t + horizon_sec].
     """
-    end_t = start_t + horizon_sec
-    for ev in recent_kill_events:
-        # NOTE: we are assuming 'VictimName' in ChampionKill uses same naming
-        # as snapshot keys (summonerName like "Corki Bot" or "JackDaCoc#NA1").
-        if ev.get("victim") == player_name:
-            ev_t = ev.get("time", 0.0)
-            if start_t <= ev_t <= end_t:
-                return 1
-    return 0
+    # NOTE: VictimName and snapshot keys (summonerName like "Corki Bot" or
+    # "JackDaCoc#NA1") are matched with the #tag ignored
+    return int(kill_index.died_between(player_name, start_t, start_t + horizon_sec))
 
 
 def main_loop():
@@ -174,7 +160,7 @@ def main_loop():
             ok, raw_or_txt = safe_get_live_json()
         except Exception as e:
             print("No live frame yet (cannot reach client at all):", e)
-            time.sleep(1)
+            poller.sleep()
             continue
 
         # 2. If not valid JSON yet (champ select / lobby / weird), skip
@@ -183,10 +169,11 @@ def main_loop():
             if len(preview) > 300:
                 preview = preview[:300] + "..."
             print("Client responded but not game-ready. Preview:", preview)
-            time.sleep(1)
+            poller.sleep()
             continue
 
         raw = raw_or_txt
+        recorder.record(raw)
 
         # 3. Parse snapshot using your schema
         try:
@@ -204,7 +191,7 @@ def main_loop():
             except Exception as inner:
                 print("debug dump failed:", inner)
 
-            time.sleep(1)
+            poller.sleep()
             continue
 
         # 4. We got a snapshot: print it
@@ -266,13 +253,15 @@ def main_loop():
 
         recent_frames = still_recent
 
-        time.sleep(1)
+        poller.sleep()
 
 
 if __name__ == "__main__":
     try:
         main_loop()
     finally:
+        recorder.close()
+
         # dump CSV on Ctrl+C
         try:
             import pandas as pd
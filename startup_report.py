@@ -0,0 +1,116 @@
+#measures how long lol_overlay.py (or its frozen build) takes to import and
+#(with a display) to draw its first frame, and fails if either is over budget
+#
+#   python startup_report.py              # import breakdown + budget check
+#   python startup_report.py --launch 3   # also time 3 real launches to first frame
+#   python startup_report.py --exe dist/LeagueMLPredictor/LeagueMLPredictor.exe --launch 5
+#                                         # same for a frozen build (first launch = cold)
+#
+#the import breakdown comes from `python -X importtime`, summed per top-level
+#package, so a heavy dependency sneaking back onto the startup path shows up
+#by name
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+# ---------- CONFIG ----------
+IMPORT_BUDGET_MS = 150        # `import lol_overlay`, everything included
+FIRST_FRAME_BUDGET_MS = 1000  # process start -> window drawn
+TOP_N = 12
+# ----------------------------
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def import_breakdown(module='lol_overlay'):
+    """{top-level package: self-time ms} and total ms for importing module"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=HERE, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr[-2000:]}")
+
+    per_package = defaultdict(float)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        name = name.strip()
+        per_package[name.split('.')[0]] += int(self_us) / 1000
+        if name == module:
+            total_us = int(cumulative_us)
+    return dict(per_package), total_us / 1000
+
+
+def launch_times(runs, exe=None):
+    """
+    Wall-clock ms from process start until it exits after its first frame,
+    for `runs` launches. The first launch is the cold one (nothing in the OS
+    file cache yet for a fresh build).
+    """
+    command = [exe] if exe else [sys.executable, 'lol_overlay.py']
+    times = []
+    for _ in range(runs):
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            report_path = f.name
+        started = time.perf_counter()
+        subprocess.run(
+            command + ['--exit-after-first-frame', '--startup-report', report_path],
+            cwd=HERE, capture_output=True, timeout=60
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        try:
+            with open(report_path) as f:
+                drew_frame = 'first frame' in json.load(f)
+        except (OSError, ValueError):
+            drew_frame = False
+        os.remove(report_path)
+        times.append(elapsed_ms if drew_frame else None)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup-time report for lol_overlay.py")
+    parser.add_argument('--launch', type=int, default=0, metavar='N',
+                        help="also time N launches to first frame (needs a display)")
+    parser.add_argument('--exe', help="time a frozen build instead of python lol_overlay.py")
+    args = parser.parse_args()
+
+    failed = False
+
+    if not args.exe:
+        per_package, total_ms = import_breakdown()
+        print(f"⏱ import lol_overlay: {total_ms:.1f}ms (budget {IMPORT_BUDGET_MS}ms)")
+        for name, ms in sorted(per_package.items(), key=lambda kv: kv[1], reverse=True)[:TOP_N]:
+            print(f"  {ms:8.1f}ms  {name}")
+        failed = total_ms > IMPORT_BUDGET_MS
+
+    if args.launch:
+        times = launch_times(args.launch, args.exe)
+        if None in times:
+            print("\n✗ A launch never drew its first frame (no display?)")
+            failed = True
+        else:
+            warm = times[1:] or times
+            print(f"\n🪟 launch -> first frame: cold {times[0]:.0f}ms, "
+                  f"warm median {statistics.median(warm):.0f}ms (budget {FIRST_FRAME_BUDGET_MS}ms)")
+            if statistics.median(warm) > FIRST_FRAME_BUDGET_MS:
+                failed = True
+
+    if failed:
+        print("\n✗ Startup over budget")
+        sys.exit(1)
+    print("\n✓ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
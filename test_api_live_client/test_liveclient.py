@@ -1,7 +1,10 @@
+import os
 import requests, urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-url = "https://127.0.0.1:2999/liveclientdata/allgamedata"
+# point at mock_live_client.py with LIVE_CLIENT_URL=http://127.0.0.1:2999
+base = os.getenv("LIVE_CLIENT_URL", "https://127.0.0.1:2999")
+url = f"{base}/liveclientdata/allgamedata"
 try:
     r = requests.get(url, verify=False, timeout=1)
     print("status:", r.status_code)
@@ -0,0 +1,180 @@
+#win probability / gold diff history for the overlay
+#
+#TimelineBuffer is a fixed-size numpy buffer of min/max/last columns, one
+#column per BUCKET_SEC of game time. When a long game runs past the last
+#column, neighbouring columns are merged pairwise (min of mins, max of maxes)
+#and the bucket doubles, so the whole game always fits in the same memory.
+#
+#TimelineChart draws it on a Tk Canvas incrementally: a tick only moves or
+#adds the items of the newest column, so drawing cost doesn't grow with the
+#game. Only a compaction or a gold-scale change redraws everything (a handful
+#of times per game).
+#
+#   buffer.append(game_time, (win_prob, gold_diff))   # any thread
+#   chart.draw()                                        # Tk thread (via ui_queue)
+
+import threading
+
+import numpy as np
+
+# ---------- CONFIG ----------
+COLUMNS = 140              # must be even; 140 x 15s = 35 min before the first compaction
+BUCKET_SEC = 15
+GOLD_SCALE = 2000          # initial +/- range of the gold line; doubles when exceeded
+# ----------------------------
+
+WIN_PROB, GOLD_DIFF = 0, 1
+
+
+class TimelineBuffer:
+    def __init__(self, columns=COLUMNS, bucket_sec=BUCKET_SEC, n_series=2):
+        if columns % 2:
+            raise ValueError("columns must be even (compaction merges pairs)")
+        self.columns = columns
+        self.base_bucket_sec = bucket_sec
+        self.n_series = n_series
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            shape = (self.columns, self.n_series)
+            self.lo = np.full(shape, np.nan)
+            self.hi = np.full(shape, np.nan)
+            self.last = np.full(shape, np.nan)
+            self.count = 0              # columns in use
+            self.bucket_sec = self.base_bucket_sec
+            self.generation = getattr(self, 'generation', 0) + 1   # bumps force a full redraw
+
+    def append(self, game_time, values):
+        """Fold one sample into its column; O(1) except for the rare compaction"""
+        v = np.asarray(values, dtype=np.float64)
+        with self.lock:
+            col = int(game_time // self.bucket_sec)
+            while col >= self.columns:
+                self._compact()
+                col = int(game_time // self.bucket_sec)
+            col = max(col, self.count - 1)   # late sample: fold into the newest column
+
+            if col >= self.count or np.isnan(self.last[col, 0]):
+                self.lo[col] = v
+                self.hi[col] = v
+                self.count = col + 1
+            else:
+                np.fmin(self.lo[col], v, out=self.lo[col])
+                np.fmax(self.hi[col], v, out=self.hi[col])
+            self.last[col] = v
+
+    def _compact(self):
+        half = self.columns // 2
+        self.lo[:half] = np.fmin(self.lo[0::2], self.lo[1::2])
+        self.hi[:half] = np.fmax(self.hi[0::2], self.hi[1::2])
+        second = self.last[1::2]
+        self.last[:half] = np.where(np.isnan(second), self.last[0::2], second)
+        self.lo[half:] = self.hi[half:] = self.last[half:] = np.nan
+        self.count = (self.count + 1) // 2
+        self.bucket_sec *= 2
+        self.generation += 1
+
+    def since(self, start):
+        """(generation, count, lo, hi, last) with copies of columns start..count-1"""
+        with self.lock:
+            start = max(0, start)
+            return (self.generation, self.count,
+                    self.lo[start:self.count].copy(),
+                    self.hi[start:self.count].copy(),
+                    self.last[start:self.count].copy())
+
+
+class TimelineChart:
+    SERIES_COLORS = ('#00ff88', '#ffcc66')   # win prob, gold diff
+
+    def __init__(self, parent, buffer, width=280, height=56, bg='#2a2a2a'):
+        import tkinter as tk
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.col_w = width / buffer.columns
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=bg, highlightthickness=0)
+
+        mid = height / 2
+        self.canvas.create_line(0, mid, width, mid, fill='#444444', dash=(2, 2))
+        self.canvas.create_text(3, 2, anchor='nw', text="win %", fill=self.SERIES_COLORS[0], font=("Segoe UI", 7))
+        self.canvas.create_text(35, 2, anchor='nw', text="gold", fill=self.SERIES_COLORS[1], font=("Segoe UI", 7))
+
+        self.gold_scale = GOLD_SCALE
+        self.generation = None
+        self.drawn = 0          # columns drawn so far (the newest may still be changing)
+        self.newest_ids = None  # canvas items of the newest drawn column
+        self.newest_last = None
+        self.before_last = None # last value of the drawn column before the newest
+
+    def y(self, series, value):
+        if series == WIN_PROB:
+            frac = value
+        else:
+            frac = 0.5 + value / (2 * self.gold_scale)
+        return self.height - 1 - frac * (self.height - 2)
+
+    def fit_gold_scale(self, lo, hi):
+        """Double the gold range until it fits; True if it changed"""
+        gold = np.abs(np.concatenate([lo[:, GOLD_DIFF], hi[:, GOLD_DIFF]]))
+        gold = gold[~np.isnan(gold)]
+        if not gold.size:
+            return False
+        peak = gold.max()
+        changed = False
+        while peak > self.gold_scale:
+            self.gold_scale *= 2
+            changed = True
+        return changed
+
+    def draw(self):
+        """Bring the canvas up to date with the buffer; call from the Tk thread"""
+        # re-read the newest drawn column too: it may have taken more samples
+        start = max(0, self.drawn - 1)
+        generation, count, lo, hi, last = self.buffer.since(start)
+        if generation != self.generation or self.fit_gold_scale(lo, hi):
+            self.redraw()
+            return
+        for offset in range(len(last)):
+            self.draw_column(start + offset, lo[offset], hi[offset], last[offset])
+
+    def redraw(self):
+        self.canvas.delete('series')
+        self.drawn = 0
+        self.newest_ids = self.newest_last = self.before_last = None
+        self.generation, count, lo, hi, last = self.buffer.since(0)
+        self.fit_gold_scale(lo, hi)
+        for col in range(count):
+            self.draw_column(col, lo[col], hi[col], last[col])
+
+    def draw_column(self, col, lo, hi, last):
+        """Add column col, or move the items of the newest one if it's already drawn"""
+        if np.isnan(last[0]):
+            return   # no samples in this bucket (client was away)
+        updating = self.newest_ids is not None and col == self.drawn - 1
+        prev = self.before_last if updating else self.newest_last
+
+        x0 = col * self.col_w
+        x1 = x0 + self.col_w
+        coords = []
+        for s in range(len(last)):
+            y_last = self.y(s, last[s])
+            y_prev = self.y(s, prev[s]) if prev is not None else y_last
+            # connector from the previous column's close, then a min/max bar
+            coords.append(((x0, y_prev, x1, y_last), (x1, self.y(s, lo[s]), x1, self.y(s, hi[s]) - 1)))
+
+        if updating:
+            for (connector_id, bar_id), (connector, bar) in zip(self.newest_ids, coords):
+                self.canvas.coords(connector_id, *connector)
+                self.canvas.coords(bar_id, *bar)
+        else:
+            self.newest_ids = [
+                (self.canvas.create_line(*connector, fill=color, tags='series'),
+                 self.canvas.create_line(*bar, fill=color, tags='series'))
+                for (connector, bar), color in zip(coords, self.SERIES_COLORS)
+            ]
+            self.before_last = self.newest_last
+            self.drawn = col + 1
+        self.newest_last = last
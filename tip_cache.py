@@ -0,0 +1,128 @@
+#two-tier cache for AI tips (in-memory LRU in front of a small sqlite file)
+#
+#tips only depend on the rough shape of the game, so the key is a quantized
+#state instead of the exact numbers: two checkpoints that are "10 min, ~60%,
+#+1-2k gold, up a tower" share one tip
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# ---------- CONFIG ----------
+CACHE_FILE = 'tip_cache.sqlite3'
+MEMORY_ENTRIES = 256              # LRU size
+DISK_ENTRIES = 5000               # oldest rows are evicted past this
+TTL_SEC = 7 * 24 * 3600           # patches change the meta, so tips go stale
+
+MINUTE_BUCKET = 5                 # 10, 15, 20, ...
+PROB_BAND = 0.10                  # 50-60%, 60-70%, ...
+GOLD_BUCKET = 1000
+KILL_BUCKET = 3
+TOWER_CLAMP = 5                   # tower diff is kept exact up to +-5
+# ----------------------------
+
+
+def _bucket(value, size):
+    return int(value // size)
+
+
+def quantize_state(player_prob, player_stats, opponent_stats, game_time_min):
+    """
+    Reduce a checkpoint to the coarse state the tip actually depends on.
+    Everything is from the player's team's point of view.
+    """
+    towers = player_stats.get('towers', 0) - opponent_stats.get('towers', 0)
+    return "m{}|p{}|g{}|k{}|t{}|{}".format(
+        _bucket(game_time_min, MINUTE_BUCKET) * MINUTE_BUCKET,
+        min(_bucket(player_prob, PROB_BAND), int(1 / PROB_BAND) - 1),
+        _bucket(player_stats['gold'] - opponent_stats['gold'], GOLD_BUCKET),
+        _bucket(player_stats['kills'] - opponent_stats['kills'], KILL_BUCKET),
+        max(-TOWER_CLAMP, min(TOWER_CLAMP, towers)),
+        'W' if player_prob > 0.5 else 'L',
+    )
+
+
+class TipCache:
+    def __init__(self, path=CACHE_FILE, memory_entries=MEMORY_ENTRIES,
+                 disk_entries=DISK_ENTRIES, ttl_sec=TTL_SEC):
+        self.memory = OrderedDict()   # key -> (tips, created)
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.ttl_sec = ttl_sec
+        self.lock = threading.Lock()
+
+        # tips are requested from a worker thread, so share one guarded connection
+        try:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS tips (key TEXT PRIMARY KEY, tips TEXT, created REAL)"
+            )
+            self.db.execute("CREATE INDEX IF NOT EXISTS tips_created ON tips (created)")
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"⚠ Tip cache on disk unavailable ({e}), using memory only")
+            self.db = None
+
+    def _remember(self, key, tips, created):
+        self.memory[key] = (tips, created)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def get(self, key):
+        now = time.time()
+        with self.lock:
+            hit = self.memory.get(key)
+            if hit is not None:
+                tips, created = hit
+                if now - created < self.ttl_sec:
+                    self.memory.move_to_end(key)
+                    return tips
+                del self.memory[key]
+
+            if self.db is None:
+                return None
+            row = self.db.execute(
+                "SELECT tips, created FROM tips WHERE key = ? AND created > ?",
+                (key, now - self.ttl_sec)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+            return row[0]
+
+    def put(self, key, tips):
+        now = time.time()
+        with self.lock:
+            self._remember(key, tips, now)
+            if self.db is None:
+                return
+            try:
+                self.db.execute("INSERT OR REPLACE INTO tips VALUES (?, ?, ?)", (key, tips, now))
+                self.db.execute("DELETE FROM tips WHERE created <= ?", (now - self.ttl_sec,))
+                self.db.execute(
+                    "DELETE FROM tips WHERE key IN "
+                    "(SELECT key FROM tips ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                    (self.disk_entries,)
+                )
+                self.db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠ Could not write tip cache: {e}")
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+
+
+if __name__ == "__main__":
+    if os.path.exists(CACHE_FILE):
+        cache = TipCache()
+        count = cache.db.execute("SELECT COUNT(*) FROM tips").fetchone()[0]
+        print(f"📁 {CACHE_FILE}: {count} cached tips")
+        cache.close()
+    else:
+        print(f"No tip cache at {CACHE_FILE} yet")
@@ -0,0 +1,77 @@
+#speculative tip prefetch ahead of the checkpoint minutes
+#
+#tips used to be requested only once a checkpoint minute had started, so they
+#always arrived late. Between PREFETCH_LEAD_SEC before a checkpoint, the
+#overlay projects the recent trajectory (linear fit over the last
+#TRAJECTORY_WINDOW_SEC) to the checkpoint time, quantizes it like a real
+#checkpoint (tip_cache.quantize_state) and fetches a tip for that key in the
+#background. If the real checkpoint lands in the same bucket the tip is
+#already cached and shows instantly; otherwise the normal request runs.
+
+from collections import deque
+
+import numpy as np
+
+# ---------- CONFIG ----------
+PREFETCH_LEAD_SEC = (30, 60)      # prefetch once the checkpoint is this close
+TRAJECTORY_WINDOW_SEC = 90        # samples used for the linear projection
+MIN_SAMPLES = 5
+# ----------------------------
+
+# projected columns
+PROB, PLAYER_GOLD, OPPONENT_GOLD, PLAYER_KILLS, OPPONENT_KILLS = range(5)
+
+
+class Trajectory:
+    """Recent (time, state) samples from the player's team's point of view"""
+
+    def __init__(self, window_sec=TRAJECTORY_WINDOW_SEC):
+        self.window_sec = window_sec
+        self.samples = deque()
+        self.towers = (0, 0)
+
+    def reset(self):
+        self.samples.clear()
+        self.towers = (0, 0)
+
+    def add(self, game_time, player_prob, player_stats, opponent_stats):
+        self.samples.append((game_time, player_prob,
+                             player_stats['gold'], opponent_stats['gold'],
+                             player_stats['kills'], opponent_stats['kills']))
+        # structures fall in steps; a slope through them means nothing, keep the count
+        self.towers = (player_stats.get('towers', 0), opponent_stats.get('towers', 0))
+        while self.samples and game_time - self.samples[0][0] > self.window_sec:
+            self.samples.popleft()
+
+    def project(self, target_time):
+        """(player_prob, player_stats, opponent_stats) extrapolated to target_time, or None"""
+        if len(self.samples) < MIN_SAMPLES:
+            return None
+        data = np.array(self.samples, dtype=np.float64)
+        t, values = data[:, 0], data[:, 1:]
+        dt = t - t.mean()
+        var = float(dt @ dt)
+        if var == 0:
+            return None
+        slope = dt @ (values - values.mean(axis=0)) / var
+        projected = values.mean(axis=0) + slope * (target_time - t.mean())
+        # never extrapolate past what's physically possible
+        projected[PROB] = min(0.99, max(0.01, projected[PROB]))
+        projected[1:] = np.maximum(projected[1:], 0)
+        kills = [PLAYER_KILLS, OPPONENT_KILLS]
+        projected[kills] = np.maximum(np.round(projected[kills]), values[-1, kills])   # kills never go down
+
+        player_stats = {'gold': float(projected[PLAYER_GOLD]), 'kills': int(projected[PLAYER_KILLS]),
+                        'towers': self.towers[0]}
+        opponent_stats = {'gold': float(projected[OPPONENT_GOLD]), 'kills': int(projected[OPPONENT_KILLS]),
+                          'towers': self.towers[1]}
+        return float(projected[PROB]), player_stats, opponent_stats
+
+
+def due_checkpoint(game_time, checkpoints_min, done=()):
+    """The checkpoint minute whose prefetch window game_time is in (not yet in done), or None"""
+    low, high = PREFETCH_LEAD_SEC
+    for minute in checkpoints_min:
+        if minute not in done and low <= minute * 60 - game_time <= high:
+            return minute
+    return None
@@ -0,0 +1,112 @@
+#precomputed tips for a grid of coarse game states (tip_table.json)
+#
+#build_tip_table.py fills every cell of minute x win-prob x gold/tower/dragon
+#diff offline; at runtime a checkpoint is bucketed into its cell and the tip is
+#a list index away, so the overlay has advice with no key and no network. A
+#live LLM tip (when configured) replaces it once it arrives.
+#
+#the file stores each distinct tip once plus one index per cell in grid order:
+#
+#   {"version": 1, "bands": {...}, "tips": ["...", ...], "grid": [3, 0, 17, ...]}
+
+import json
+import os
+
+# ---------- CONFIG ----------
+TABLE_FILE = 'tip_table.json'
+TABLE_VERSION = 1
+
+MINUTES = (10, 15, 20, 25, 30, 35, 40)      # checkpoint minute bucket (clamped)
+PROB_EDGES = (0.2, 0.4, 0.5, 0.6, 0.8)      # 6 win-prob bands; 0.5 so none straddles win/lose
+GOLD_EDGES = (-3000, -1000, 1000, 3000)     # 5 gold-diff bands
+TOWER_CLAMP = 2                             # tower diff -2..+2
+DRAGON_CLAMP = 2                            # dragon diff -2..+2
+# ----------------------------
+
+
+def _band(value, edges):
+    for i, edge in enumerate(edges):
+        if value < edge:
+            return i
+    return len(edges)
+
+
+def _clamp(value, limit):
+    return max(-limit, min(limit, int(value)))
+
+
+def grid_shape():
+    """Size of each dimension, in cell order"""
+    return (len(MINUTES), len(PROB_EDGES) + 1, len(GOLD_EDGES) + 1,
+            2 * TOWER_CLAMP + 1, 2 * DRAGON_CLAMP + 1)
+
+
+def cell(player_prob, player_stats, opponent_stats, game_time_min):
+    """(minute, prob band, gold band, tower diff, dragon diff) from the player's team's side"""
+    minute = min(MINUTES, key=lambda m: abs(m - game_time_min))
+    return (
+        minute,
+        _band(player_prob, PROB_EDGES),
+        _band(player_stats['gold'] - opponent_stats['gold'], GOLD_EDGES),
+        _clamp(player_stats.get('towers', 0) - opponent_stats.get('towers', 0), TOWER_CLAMP),
+        _clamp(player_stats.get('dragons', 0) - opponent_stats.get('dragons', 0), DRAGON_CLAMP),
+    )
+
+
+def cell_index(minute, prob_band, gold_band, tower_diff, dragon_diff):
+    """Row-major position of a cell in the grid"""
+    index = 0
+    coords = (MINUTES.index(minute), prob_band, gold_band,
+              tower_diff + TOWER_CLAMP, dragon_diff + DRAGON_CLAMP)
+    for coord, size in zip(coords, grid_shape()):
+        index = index * size + coord
+    return index
+
+
+def bands():
+    """Grid definition saved with the table, so a stale file can be detected"""
+    return {
+        'minutes': list(MINUTES), 'prob_edges': list(PROB_EDGES), 'gold_edges': list(GOLD_EDGES),
+        'tower_clamp': TOWER_CLAMP, 'dragon_clamp': DRAGON_CLAMP,
+    }
+
+
+class TipTable:
+    def __init__(self, tips, grid):
+        self.tips = tips
+        self.grid = grid
+
+    @classmethod
+    def load(cls, path=TABLE_FILE):
+        """Table from path, or None if it's missing or built for a different grid"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Could not read {path}: {e}")
+            return None
+        expected = 1
+        for size in grid_shape():
+            expected *= size
+        if (data.get('version') != TABLE_VERSION or data.get('bands') != bands()
+                or len(data.get('grid', ())) != expected):
+            print(f"⚠ {path} was built for a different grid; run build_tip_table.py")
+            return None
+        return cls(data['tips'], data['grid'])
+
+    def lookup(self, player_prob, player_stats, opponent_stats, game_time_min):
+        return self.tips[self.grid[cell_index(*cell(player_prob, player_stats, opponent_stats, game_time_min))]]
+
+
+def save_table(tips_by_cell, path=TABLE_FILE):
+    """Write {cell index: tip} (every cell filled) with duplicate tips stored once"""
+    unique = {}
+    grid = []
+    for index in range(len(tips_by_cell)):
+        grid.append(unique.setdefault(tips_by_cell[index], len(unique)))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': TABLE_VERSION, 'bands': bands(), 'tips': list(unique), 'grid': grid},
+                  f, separators=(',', ':'))
+    return len(unique)
@@ -0,0 +1,114 @@
+#timer/animation scheduler for the Tk overlay
+#
+#animations are generators: each step does its (tiny) bit of UI work and then
+#yields how many ms to wait before the next step. The scheduler drives them
+#with root.after, so nothing ever sleeps on the Tk main loop.
+#
+#   scheduler.start('flash', flash(root, rest_alpha=0.70))
+#
+#UpdateQueue is the only way background threads talk to Tk: they post a
+#callable per widget key, the Tk loop drains the queue once per frame, and
+#only the newest update for each key survives until then.
+
+import threading
+
+FRAME_MS = 16   # ~60 fps
+
+
+class UIScheduler:
+    def __init__(self, root):
+        self.root = root
+        self.tasks = {}   # name -> pending after() id
+
+    def start(self, name, steps):
+        """Run a generator-based animation; restarts it if one with this name is running"""
+        self.cancel(name)
+        self._step(name, steps)
+
+    def _step(self, name, steps):
+        try:
+            delay = next(steps)
+        except StopIteration:
+            self.tasks.pop(name, None)
+            return
+        self.tasks[name] = self.root.after(max(0, int(delay)), self._step, name, steps)
+
+    def every(self, name, interval_ms, callback):
+        """Call callback every interval_ms until cancelled"""
+        def repeat():
+            while True:
+                callback()
+                yield interval_ms
+        self.start(name, repeat())
+
+    def cancel(self, name):
+        after_id = self.tasks.pop(name, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+
+    def cancel_all(self):
+        for name in list(self.tasks):
+            self.cancel(name)
+
+
+def fade(root, start_alpha, end_alpha, duration_ms, frame_ms=FRAME_MS):
+    """Linearly move the window alpha from start_alpha to end_alpha"""
+    frames = max(1, duration_ms // frame_ms)
+    for i in range(1, frames + 1):
+        root.attributes('-alpha', start_alpha + (end_alpha - start_alpha) * i / frames)
+        if i < frames:
+            yield frame_ms
+
+
+def flash(root, rest_alpha, peak_alpha=1.0, times=3, period_ms=400):
+    """Pulse the window to full opacity and fade back, `times` times"""
+    for _ in range(times):
+        root.attributes('-alpha', peak_alpha)
+        yield period_ms // 2
+        yield from fade(root, peak_alpha, rest_alpha, period_ms // 2)
+        yield FRAME_MS
+    root.attributes('-alpha', rest_alpha)
+
+
+def countdown(seconds, on_tick, on_done=None):
+    """Call on_tick(remaining) once a second, then on_done()"""
+    for remaining in range(int(seconds), 0, -1):
+        on_tick(remaining)
+        yield 1000
+    if on_done is not None:
+        on_done()
+
+
+class UpdateQueue:
+    def __init__(self):
+        self.pending = {}   # key -> callable, newest wins
+        self.lock = threading.Lock()
+        self.posted = 0
+        self.applied = 0
+
+    def post(self, key, update):
+        """Thread-safe; replaces any not-yet-applied update with the same key"""
+        with self.lock:
+            # re-insert so drain order follows the latest post
+            self.pending.pop(key, None)
+            self.pending[key] = update
+            self.posted += 1
+
+    def drain(self):
+        """Apply pending updates; call only from the Tk thread"""
+        with self.lock:
+            if not self.pending:
+                return
+            updates = list(self.pending.values())
+            self.pending.clear()
+        for update in updates:
+            try:
+                update()
+            except Exception as e:
+                # one bad update must not stop the queue from draining
+                print(f"✗ UI update failed: {e}")
+            self.applied += 1
+
+    def attach(self, scheduler, frame_ms=FRAME_MS * 3):
+        """Drain on the Tk loop at a fixed frame rate"""
+        scheduler.every('ui_queue', frame_ms, self.drain)
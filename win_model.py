@@ -0,0 +1,121 @@
+#win predictor as plain numpy weights
+#
+#the saved model is a StandardScaler + LogisticRegression, which is just a dot
+#product once the scaler is folded into the weights:
+#   logit = w . (x - mean) / scale + b  =  (w / scale) . x + (b - (w / scale) . mean)
+#so bulk/live scoring doesn't need pandas or sklearn's per-call overhead
+#
+#the folded weights are also saved as league_win_predictor.npz, a pickle-free
+#artifact the overlay (and its frozen build) can load without sklearn
+
+import math
+import os
+import pickle
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+# ---------- CONFIG ----------
+MODEL_FILE = 'league_win_predictor.pkl'
+SCALER_FILE = 'scaler.pkl'
+ARTIFACT_FILE = 'league_win_predictor.npz'
+# ----------------------------
+
+FEATURE_COLS = [
+    'kills_diff', 'deaths_diff', 'assists_diff',
+    'gold_diff', 'cs_diff', 'level_diff',
+    'towers_diff', 'inhibs_diff', 'dragons_diff',
+    'heralds_diff', 'barons_diff'
+]
+
+LinearWinModel = namedtuple('LinearWinModel', ['weights', 'bias'])
+
+
+def fold_scaler(model, scaler):
+    """Collapse scaler + logistic regression into one weight vector and bias"""
+    w = np.asarray(model.coef_[0], dtype=np.float64)
+    b = float(model.intercept_[0])
+
+    scale = getattr(scaler, 'scale_', None)
+    mean = getattr(scaler, 'mean_', None)
+    if scale is not None:
+        w = w / scale
+    if mean is not None:
+        b -= float(np.dot(w, mean))
+
+    return LinearWinModel(weights=w, bias=b)
+
+
+def load_linear_model(model_file=MODEL_FILE, scaler_file=SCALER_FILE):
+    with open(model_file, 'rb') as f:
+        model = pickle.load(f)
+    with open(scaler_file, 'rb') as f:
+        scaler = pickle.load(f)
+    return fold_scaler(model, scaler)
+
+
+def save_artifact(linear_model, path=ARTIFACT_FILE):
+    np.savez(
+        path,
+        weights=linear_model.weights,
+        bias=np.array([linear_model.bias]),
+        feature_cols=np.array(FEATURE_COLS),
+    )
+
+
+def load_artifact(path=ARTIFACT_FILE):
+    with np.load(path, allow_pickle=False) as artifact:
+        if list(artifact['feature_cols']) != FEATURE_COLS:
+            raise ValueError(f"{path} was saved for different features: {list(artifact['feature_cols'])}")
+        return LinearWinModel(weights=artifact['weights'].copy(), bias=float(artifact['bias'][0]))
+
+
+def resource_path(name):
+    """name in the working directory, else next to this module / in the frozen bundle"""
+    if os.path.exists(name):
+        return name
+    base = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
+
+
+def load_live_model():
+    """Pickle-free artifact if there is one, otherwise fold the sklearn pickles"""
+    artifact = resource_path(ARTIFACT_FILE)
+    if os.path.exists(artifact):
+        return load_artifact(artifact)
+    return load_linear_model(resource_path(MODEL_FILE), resource_path(SCALER_FILE))
+
+
+def predict_blue_proba(X, linear_model):
+    """P(blue wins) for every row of an (n, len(FEATURE_COLS)) array"""
+    logits = np.asarray(X, dtype=np.float64) @ linear_model.weights + linear_model.bias
+    # numerically stable sigmoid
+    return np.exp(-np.logaddexp(0.0, -logits))
+
+
+class LiveScorer:
+    """
+    Scores one game state at a time without allocating: features are written
+    into a preallocated buffer and the probability is a single dot product
+    """
+
+    def __init__(self, linear_model):
+        self.weights = np.ascontiguousarray(linear_model.weights, dtype=np.float64)
+        self.bias = float(linear_model.bias)
+        self.features = np.zeros(len(FEATURE_COLS), dtype=np.float64)
+        self.index = {name: i for i, name in enumerate(FEATURE_COLS)}
+
+    def set_features(self, features):
+        """Copy a {feature_name: value} dict into the buffer"""
+        buf = self.features
+        for name, value in features.items():
+            buf[self.index[name]] = value
+
+    def score(self):
+        """P(blue wins) for the features currently in the buffer"""
+        logit = float(self.features @ self.weights) + self.bias
+        if logit >= 0:
+            return 1.0 / (1.0 + math.exp(-logit))
+        z = math.exp(logit)
+        return z / (1.0 + z)